@@ -67,6 +67,9 @@ from triage_automation.infrastructure.pdf.text_extractor import PdfTextExtractor
 
 logger = logging.getLogger(__name__)
 
+# Prompt activations happen in the bot API process, so the worker only bounds staleness.
+_PROMPT_PAIR_CACHE_TTL_SECONDS = 10.0
+
 
 class MatrixRuntimeClientPort(Protocol):
     """Matrix operations required by worker runtime services."""
@@ -182,7 +185,8 @@ def build_runtime_services(
     prior_case_queries = SqlAlchemyPriorCaseQueries(session_factory)
 
     prompt_templates = PromptTemplateService(
-        prompt_templates=SqlAlchemyPromptTemplateRepository(session_factory)
+        prompt_templates=SqlAlchemyPromptTemplateRepository(session_factory),
+        pair_cache_ttl_seconds=_PROMPT_PAIR_CACHE_TTL_SECONDS,
     )
     llm1_service = Llm1Service(llm_client=llm1_client, prompt_templates=prompt_templates)
     llm2_service = Llm2Service(llm_client=llm2_client, prompt_templates=prompt_templates)
@@ -4,23 +4,26 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import Field, field_validator
 
+from triage_automation.application.dto.base import StrictModel
+from triage_automation.domain.auth.credentials import normalize_user_email
 from triage_automation.domain.auth.roles import Role
 
 
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
-
-    model_config = ConfigDict(extra="forbid")
-
-
 class LoginRequest(StrictModel):
     """HTTP request body contract for opaque-token login."""
 
     email: str = Field(min_length=3)
     password: str = Field(min_length=1)
 
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        """Normalize login email once at the API boundary to match stored accounts."""
+
+        return normalize_user_email(email=value)
+
 
 class LoginResponse(StrictModel):
     """HTTP success response for opaque-token login."""
@@ -0,0 +1,11 @@
+"""Shared pydantic base model for DTO contracts."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class StrictModel(BaseModel):
+    """Base model with strict unknown-field rejection and lazy schema build."""
+
+    model_config = ConfigDict(extra="forbid", defer_build=True)
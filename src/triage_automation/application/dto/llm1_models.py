@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import Field, StringConstraints
 
+from triage_automation.application.dto.base import StrictModel
 
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
+Confidence = Literal["alta", "media", "baixa"]
+YesNoUnknown = Literal["yes", "no", "unknown"]
 
-    model_config = ConfigDict(extra="forbid")
+AgencyRecordNumber = Annotated[str, StringConstraints(pattern=r"^[0-9]{5,}$")]
 
 
 class Llm1Patient(StrictModel):
@@ -41,8 +42,8 @@ class Llm1Labs(StrictModel):
 class Llm1Ecg(StrictModel):
     """ECG availability and abnormality signal."""
 
-    report_present: Literal["yes", "no", "unknown"]
-    abnormal_flag: Literal["yes", "no", "unknown"]
+    report_present: YesNoUnknown
+    abnormal_flag: YesNoUnknown
     source_text_hint: str | None
 
 
@@ -50,7 +51,7 @@ class Llm1Asa(StrictModel):
     """ASA class estimate and confidence."""
 
     class_: Literal["I", "II", "III", "IV", "V", "unknown"] = Field(alias="class")
-    confidence: Literal["alta", "media", "baixa"]
+    confidence: Confidence
     rationale: str | None
 
 
@@ -58,7 +59,7 @@ class Llm1CardiovascularRisk(StrictModel):
     """Cardiovascular risk assessment and confidence."""
 
     level: Literal["low", "moderate", "high", "unknown"]
-    confidence: Literal["alta", "media", "baixa"]
+    confidence: Confidence
     rationale: str | None
 
 
@@ -89,10 +90,10 @@ class Llm1PolicyPrecheck(StrictModel):
     excluded_from_eda_flow: bool
     exclusion_reason: str | None
     labs_required: bool
-    labs_pass: Literal["yes", "no", "unknown"]
-    labs_failed_items: list[str]
+    labs_pass: YesNoUnknown
+    labs_failed_items: tuple[str, ...]
     ecg_required: bool
-    ecg_present: Literal["yes", "no", "unknown"]
+    ecg_present: YesNoUnknown
     pediatric_flag: bool
     notes: str | None
 
@@ -101,14 +102,14 @@ class Llm1Summary(StrictModel):
     """Human-readable one-liner and supporting bullets."""
 
     one_liner: str
-    bullet_points: list[str] = Field(min_length=3, max_length=8)
+    bullet_points: tuple[str, ...] = Field(min_length=3, max_length=8)
 
 
 class Llm1ExtractionQuality(StrictModel):
     """Quality/confidence metadata for extraction completeness."""
 
-    confidence: Literal["alta", "media", "baixa"]
-    missing_fields: list[str]
+    confidence: Confidence
+    missing_fields: tuple[str, ...]
     notes: str | None
 
 
@@ -117,7 +118,7 @@ class Llm1Response(StrictModel):
 
     schema_version: Literal["1.1"]
     language: Literal["pt-BR"]
-    agency_record_number: str = Field(pattern=r"^[0-9]{5,}$")
+    agency_record_number: AgencyRecordNumber
     patient: Llm1Patient
     eda: Llm1Eda
     policy_precheck: Llm1PolicyPrecheck
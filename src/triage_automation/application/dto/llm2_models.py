@@ -4,13 +4,10 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import Field
 
-
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
-
-    model_config = ConfigDict(extra="forbid")
+from triage_automation.application.dto.base import StrictModel
+from triage_automation.application.dto.llm1_models import AgencyRecordNumber, Confidence
 
 
 class Llm2Rationale(StrictModel):
@@ -37,9 +34,9 @@ class Llm2Response(StrictModel):
     schema_version: Literal["1.1"]
     language: Literal["pt-BR"]
     case_id: str
-    agency_record_number: str = Field(pattern=r"^[0-9]{5,}$")
+    agency_record_number: AgencyRecordNumber
     suggestion: Literal["accept", "deny"]
     support_recommendation: Literal["none", "anesthesist", "anesthesist_icu", "unknown"]
     rationale: Llm2Rationale
     policy_alignment: Llm2PolicyAlignment
-    confidence: Literal["alta", "media", "baixa"]
+    confidence: Confidence
@@ -3,20 +3,22 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import Field
 
+from triage_automation.application.dto.base import StrictModel
+from triage_automation.application.ports.case_repository_port import (
+    CaseMonitoringDetail,
+    CaseMonitoringListPage,
+)
+from triage_automation.application.ports.case_repository_port import (
+    CaseMonitoringTimelineItem as CaseMonitoringTimelineRow,
+)
 from triage_automation.domain.case_status import CaseStatus
 
 
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
-
-    model_config = ConfigDict(extra="forbid")
-
-
 class MonitoringCaseListItem(StrictModel):
     """One case row rendered in dashboard list responses."""
 
@@ -33,6 +35,24 @@ class MonitoringCaseListResponse(StrictModel):
     page_size: int = Field(ge=1)
     total: int = Field(ge=0)
 
+    @classmethod
+    def from_repository_page(cls, page: CaseMonitoringListPage) -> MonitoringCaseListResponse:
+        """Build response from repository rows whose types are already guaranteed."""
+
+        return cls.model_construct(
+            items=[
+                MonitoringCaseListItem.model_construct(
+                    case_id=item.case_id,
+                    status=item.status,
+                    latest_activity_at=item.latest_activity_at,
+                )
+                for item in page.items
+            ],
+            page=page.page,
+            page_size=page.page_size,
+            total=page.total,
+        )
+
 
 class MonitoringCaseListQueryParams(StrictModel):
     """Validated query-parameter contract for monitoring case listing."""
@@ -47,7 +67,7 @@ class MonitoringCaseListQueryParams(StrictModel):
 class MonitoringCaseTimelineItem(StrictModel):
     """One unified timeline event in case-detail responses."""
 
-    source: str
+    source: Literal["pdf", "llm", "matrix"]
     channel: str
     timestamp: datetime
     room_id: str | None
@@ -56,6 +76,21 @@ class MonitoringCaseTimelineItem(StrictModel):
     content_text: str | None
     payload: dict[str, Any] | None
 
+    @classmethod
+    def from_repository_row(cls, row: CaseMonitoringTimelineRow) -> MonitoringCaseTimelineItem:
+        """Build timeline item from a repository row whose types are already guaranteed."""
+
+        return cls.model_construct(
+            source=row.source,
+            channel=row.channel,
+            timestamp=row.timestamp,
+            room_id=row.room_id,
+            actor=row.actor,
+            event_type=row.event_type,
+            content_text=row.content_text,
+            payload=row.payload,
+        )
+
 
 class MonitoringCaseDetailResponse(StrictModel):
     """Case-detail response with unified chronological timeline."""
@@ -63,3 +98,15 @@ class MonitoringCaseDetailResponse(StrictModel):
     case_id: UUID
     status: CaseStatus
     timeline: list[MonitoringCaseTimelineItem]
+
+    @classmethod
+    def from_repository_detail(cls, detail: CaseMonitoringDetail) -> MonitoringCaseDetailResponse:
+        """Build response from repository timeline rows whose types are already guaranteed."""
+
+        return cls.model_construct(
+            case_id=detail.case_id,
+            status=detail.status,
+            timeline=[
+                MonitoringCaseTimelineItem.from_repository_row(item) for item in detail.timeline
+            ],
+        )
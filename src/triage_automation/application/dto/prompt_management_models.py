@@ -2,13 +2,9 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import Field
 
-
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
-
-    model_config = ConfigDict(extra="forbid")
+from triage_automation.application.dto.base import StrictModel
 
 
 class PromptVersionItem(StrictModel):
@@ -3,38 +3,31 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from functools import cached_property
+from typing import Literal, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-
-
-class StrictModel(BaseModel):
-    """Base model with strict unknown-field rejection."""
-
-    model_config = ConfigDict(extra="forbid")
+from pydantic import Field, model_validator
 
+from triage_automation.application.dto.base import StrictModel
 
 SupportFlag = Literal["none", "anesthesist", "anesthesist_icu"]
 Decision = Literal["accept", "deny"]
 
 
 def validate_decision_support_flag(*, decision: Decision, support_flag: SupportFlag) -> None:
-    """Enforce decision/support_flag invariants shared by webhook and widget contracts."""
+    """Enforce decision/support_flag invariants shared by webhook and widget contracts.
+
+    Both values are already narrowed by their literal field validators, so accept
+    admits every support flag and only the deny combination needs checking.
+    """
 
     if decision == "deny" and support_flag != "none":
         raise ValueError("decision=deny requires support_flag=none")
 
-    if decision == "accept" and support_flag not in {
-        "none",
-        "anesthesist",
-        "anesthesist_icu",
-    }:
-        raise ValueError("decision=accept requires a valid support_flag")
-
 
-class TriageDecisionWebhookPayload(StrictModel):
-    """Doctor widget callback payload contract."""
+class DecisionSubmissionModel(StrictModel):
+    """Shared doctor decision fields and invariants for webhook and widget contracts."""
 
     case_id: UUID
     doctor_user_id: str = Field(min_length=1)
@@ -45,13 +38,25 @@ class TriageDecisionWebhookPayload(StrictModel):
     widget_event_id: str | None = None
 
     @model_validator(mode="after")
-    def _validate_decision_specific_rules(self) -> TriageDecisionWebhookPayload:
+    def _validate_decision_specific_rules(self) -> Self:
+        """Reject support flags that contradict the selected decision."""
+
         validate_decision_support_flag(
             decision=self.decision,
             support_flag=self.support_flag,
         )
         return self
 
+    @cached_property
+    def submitted_at_iso(self) -> str | None:
+        """Return the submission timestamp in ISO-8601 form, formatted once per payload."""
+
+        return self.submitted_at.isoformat() if self.submitted_at is not None else None
+
+
+class TriageDecisionWebhookPayload(DecisionSubmissionModel):
+    """Doctor widget callback payload contract."""
+
 
 class TriageDecisionWebhookResponse(StrictModel):
     """HTTP response model for webhook callback endpoint."""
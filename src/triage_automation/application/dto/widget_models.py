@@ -2,17 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Literal
 from uuid import UUID
 
-from pydantic import Field, model_validator
-
+from triage_automation.application.dto.base import StrictModel
 from triage_automation.application.dto.webhook_models import (
     Decision,
-    StrictModel,
-    SupportFlag,
-    validate_decision_support_flag,
+    DecisionSubmissionModel,
 )
 
 WidgetCaseStatus = Literal["WAIT_DOCTOR"]
@@ -33,27 +29,9 @@ class WidgetDecisionBootstrapResponse(StrictModel):
     doctor_reason: str | None = None
 
 
-class WidgetDecisionSubmitRequest(StrictModel):
+class WidgetDecisionSubmitRequest(DecisionSubmissionModel):
     """HTTP request model for authenticated Room-2 decision submit."""
 
-    case_id: UUID
-    doctor_user_id: str = Field(min_length=1)
-    decision: Decision
-    support_flag: SupportFlag = "none"
-    reason: str | None = None
-    submitted_at: datetime | None = None
-    widget_event_id: str | None = None
-
-    @model_validator(mode="after")
-    def _validate_decision_specific_rules(self) -> WidgetDecisionSubmitRequest:
-        """Enforce support flag semantics shared with callback decision payloads."""
-
-        validate_decision_support_flag(
-            decision=self.decision,
-            support_flag=self.support_flag,
-        )
-        return self
-
 
 class WidgetDecisionSubmitResponse(StrictModel):
     """HTTP response model for widget decision submit endpoint."""
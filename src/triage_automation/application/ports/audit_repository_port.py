@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any, Protocol
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEventCreateInput:
     """Input payload for inserting an audit event."""
 
@@ -25,3 +26,6 @@ class AuditRepositoryPort(Protocol):
 
     async def append_event(self, payload: AuditEventCreateInput) -> int:
         """Append an audit event and return its numeric id."""
+
+    async def append_events(self, payloads: Sequence[AuditEventCreateInput]) -> None:
+        """Append several audit events in one transaction, preserving order."""
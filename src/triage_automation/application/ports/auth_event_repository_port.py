@@ -7,7 +7,7 @@ from typing import Any, Protocol
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthEventCreateInput:
     """Input payload for inserting an auth event."""
 
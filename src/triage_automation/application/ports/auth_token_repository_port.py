@@ -8,7 +8,7 @@ from typing import Protocol
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthTokenCreateInput:
     """Input payload for inserting an opaque auth token record."""
 
@@ -17,7 +17,7 @@ class AuthTokenCreateInput:
     expires_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthTokenRecord:
     """Persisted opaque auth token model."""
 
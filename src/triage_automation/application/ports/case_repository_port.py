@@ -14,7 +14,7 @@ class DuplicateCaseOriginEventError(ValueError):
     """Raised when a case with the same room1 origin event already exists."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseCreateInput:
     """Input payload for creating a case row."""
 
@@ -25,7 +25,7 @@ class CaseCreateInput:
     room1_sender_user_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseRecord:
     """Case persistence model used across repository boundaries."""
 
@@ -38,7 +38,7 @@ class CaseRecord:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseRoom2WidgetSnapshot:
     """Case fields required to build and post the Room-2 widget payload."""
 
@@ -52,7 +52,7 @@ class CaseRoom2WidgetSnapshot:
     suggested_action_json: dict[str, Any] | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseDoctorDecisionSnapshot:
     """Case fields required by doctor decision callback handling."""
 
@@ -63,7 +63,7 @@ class CaseDoctorDecisionSnapshot:
     structured_data_json: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DoctorDecisionUpdateInput:
     """Doctor decision write payload used by compare-and-set persistence."""
 
@@ -74,7 +74,20 @@ class DoctorDecisionUpdateInput:
     reason: str | None
 
 
-@dataclass(frozen=True)
+DoctorDecisionApplyOutcome = Literal["applied", "not_found", "wrong_state", "duplicate"]
+
+
+@dataclass(frozen=True, slots=True)
+class DoctorDecisionApplyResult:
+    """Outcome of a single-call doctor decision compare-and-set."""
+
+    outcome: DoctorDecisionApplyOutcome
+    current_status: CaseStatus | None = None
+    agency_record_number: str | None = None
+    structured_data_json: dict[str, Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
 class SchedulerDecisionUpdateInput:
     """Scheduler decision write payload for compare-and-set persistence."""
 
@@ -87,7 +100,7 @@ class SchedulerDecisionUpdateInput:
     appointment_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseFinalReplySnapshot:
     """Case fields required by Room-1 final reply posting handlers."""
 
@@ -105,7 +118,7 @@ class CaseFinalReplySnapshot:
     appointment_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Room1FinalReplyReactionSnapshot:
     """Case fields required by Room-1 final reaction cleanup trigger logic."""
 
@@ -114,7 +127,7 @@ class Room1FinalReplyReactionSnapshot:
     cleanup_triggered_at: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseLlmInteractionCreateInput:
     """Append-only payload for persisting LLM input/output transcript records."""
 
@@ -129,7 +142,7 @@ class CaseLlmInteractionCreateInput:
     model_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseRecoverySnapshot:
     """Case fields required for restart recovery scans."""
 
@@ -140,7 +153,7 @@ class CaseRecoverySnapshot:
     cleanup_completed_at: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringListFilter:
     """Filter/pagination options for dashboard case listing queries."""
 
@@ -151,7 +164,7 @@ class CaseMonitoringListFilter:
     page_size: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringListItem:
     """Case row projection returned by monitoring list queries."""
 
@@ -162,7 +175,7 @@ class CaseMonitoringListItem:
     agency_record_number: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringListPage:
     """Paginated monitoring list payload returned by case repository."""
 
@@ -172,7 +185,7 @@ class CaseMonitoringListPage:
     total: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringTimelineItem:
     """Unified timeline event projection for monitoring case detail."""
 
@@ -186,7 +199,7 @@ class CaseMonitoringTimelineItem:
     payload: dict[str, Any] | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringDetail:
     """Per-case monitoring detail including unified chronological timeline."""
 
@@ -220,11 +233,15 @@ class CaseRepositoryPort(Protocol):
     ) -> CaseDoctorDecisionSnapshot | None:
         """Load case state used by doctor decision callback handling."""
 
-    async def apply_doctor_decision_if_waiting(
+    async def apply_doctor_decision(
         self,
         payload: DoctorDecisionUpdateInput,
-    ) -> bool:
-        """CAS update from WAIT_DOCTOR to decision state; returns whether applied."""
+    ) -> DoctorDecisionApplyResult:
+        """CAS update from WAIT_DOCTOR to decision state, reporting why it was not applied.
+
+        A miss on a case that already has a recorded doctor decision is reported as
+        `duplicate`; any other non-waiting status is reported as `wrong_state`.
+        """
 
     async def apply_scheduler_decision_if_waiting(
         self,
@@ -285,6 +302,19 @@ class CaseRepositoryPort(Protocol):
     async def update_status(self, *, case_id: UUID, status: CaseStatus) -> None:
         """Update case status and touch updated_at timestamp."""
 
+    async def transition_status(
+        self,
+        *,
+        case_id: UUID,
+        from_statuses: frozenset[CaseStatus],
+        to_status: CaseStatus,
+    ) -> CaseStatus | None:
+        """Move case to `to_status` only from `from_statuses`, returning the prior status.
+
+        Returns None when the case is missing or not in one of `from_statuses`. The read
+        and the guarded write share one transaction but are two statements.
+        """
+
     async def store_pdf_extraction(
         self,
         *,
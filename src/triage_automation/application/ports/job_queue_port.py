@@ -8,7 +8,7 @@ from typing import Any, Protocol
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobEnqueueInput:
     """Input payload for inserting a job into the queue."""
 
@@ -19,7 +19,7 @@ class JobEnqueueInput:
     max_attempts: int = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     """Persisted queue record used by worker/runtime logic."""
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import Protocol
+from typing import NamedTuple, Protocol
 from uuid import UUID
 
 
@@ -11,7 +12,7 @@ class DuplicateCaseMessageError(ValueError):
     """Raised when the same room/event pair is inserted more than once."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMessageCreateInput:
     """Input payload for inserting a case message mapping."""
 
@@ -22,23 +23,21 @@ class CaseMessageCreateInput:
     sender_user_id: str | None = None
 
 
-@dataclass(frozen=True)
-class CaseMessageLookup:
+class CaseMessageLookup(NamedTuple):
     """Resolved case message mapping for room/event lookups."""
 
     case_id: UUID
     kind: str
 
 
-@dataclass(frozen=True)
-class CaseMessageRef:
+class CaseMessageRef(NamedTuple):
     """Room/event pair used by cleanup redaction execution."""
 
     room_id: str
     event_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMatrixMessageTranscriptCreateInput:
     """Append-only payload for full Matrix message transcript persistence."""
 
@@ -64,6 +63,13 @@ class MessageRepositoryPort(Protocol):
     ) -> int:
         """Insert one full Matrix transcript row and return its numeric id."""
 
+    async def add_message_with_transcript(
+        self,
+        message: CaseMessageCreateInput,
+        transcript: CaseMatrixMessageTranscriptCreateInput,
+    ) -> int:
+        """Insert a message mapping and its transcript atomically, returning the mapping id."""
+
     async def has_message_kind(self, *, case_id: UUID, room_id: str, kind: str) -> bool:
         """Return whether a message mapping exists for case/room/kind."""
 
@@ -84,5 +90,5 @@ class MessageRepositoryPort(Protocol):
     ) -> CaseMessageLookup | None:
         """Resolve case_id and kind for a room/event mapping."""
 
-    async def list_message_refs_for_case(self, *, case_id: UUID) -> list[CaseMessageRef]:
-        """List room/event mappings for case cleanup redaction."""
+    def iter_message_refs_for_case(self, *, case_id: UUID) -> AsyncIterator[CaseMessageRef]:
+        """Stream room/event mappings for case cleanup redaction."""
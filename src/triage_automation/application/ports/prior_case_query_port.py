@@ -10,7 +10,7 @@ from uuid import UUID
 PriorCaseDecision = Literal["deny_triage", "deny_appointment", "failed", "accepted"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriorCaseSummary:
     """Prior-case block embedded into Room-2 widget payload."""
 
@@ -20,7 +20,7 @@ class PriorCaseSummary:
     reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriorCaseContext:
     """Resolved prior-case enrichment fields for widget payload."""
 
@@ -39,3 +39,11 @@ class PriorCaseQueryPort(Protocol):
         now: datetime | None = None,
     ) -> PriorCaseContext:
         """Return most recent prior case and optional denial counter in the 7-day window."""
+
+    async def lookup_recent_context_by_case_id(
+        self,
+        *,
+        case_id: UUID,
+        now: datetime | None = None,
+    ) -> PriorCaseContext:
+        """Return the same context, resolving the record number from the current case row."""
@@ -7,7 +7,7 @@ from typing import Protocol
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptVersionRecord:
     """Prompt version metadata used by admin prompt-management flows."""
 
@@ -16,7 +16,7 @@ class PromptVersionRecord:
     is_active: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptVersionContentRecord:
     """Prompt version metadata plus immutable content payload."""
 
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 
-@dataclass(frozen=True)
-class PromptTemplateRecord:
+class PromptTemplateRecord(NamedTuple):
     """Active prompt template model used by application services."""
 
     name: str
@@ -9,7 +9,7 @@ from uuid import UUID
 ReactionCheckpointStage = Literal["ROOM2_ACK", "ROOM3_ACK", "ROOM1_FINAL"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReactionCheckpointCreateInput:
     """Input payload for registering an expected positive reaction checkpoint."""
 
@@ -19,7 +19,7 @@ class ReactionCheckpointCreateInput:
     target_event_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReactionCheckpointPositiveInput:
     """Input payload for marking one expected checkpoint as positively reacted."""
 
@@ -9,7 +9,7 @@ from typing import Literal, Protocol
 SupervisorSummaryDispatchStatus = Literal["pending", "sent", "failed"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupervisorSummaryWindowKey:
     """Unique Room-4 summary identity based on room and reporting window."""
 
@@ -18,7 +18,7 @@ class SupervisorSummaryWindowKey:
     window_end: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupervisorSummaryDispatchSentInput:
     """Payload to mark one claimed Room-4 summary dispatch as successfully sent."""
 
@@ -29,7 +29,7 @@ class SupervisorSummaryDispatchSentInput:
     sent_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupervisorSummaryDispatchRecord:
     """Persisted Room-4 summary dispatch row exposed across repository boundaries."""
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupervisorSummaryMetrics:
     """Aggregate counters rendered in one Room-4 supervisor summary message."""
 
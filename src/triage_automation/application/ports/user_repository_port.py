@@ -11,7 +11,7 @@ from triage_automation.domain.auth.account_status import AccountStatus
 from triage_automation.domain.auth.roles import Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserRecord:
     """User persistence model."""
 
@@ -25,7 +25,7 @@ class UserRecord:
     account_status: AccountStatus = AccountStatus.ACTIVE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserCreateInput:
     """Input payload for creating a persisted user."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import secrets
 from dataclasses import dataclass
 from enum import StrEnum
 
@@ -21,7 +23,7 @@ class AuthOutcome(StrEnum):
     INACTIVE_USER = "inactive_user"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthResult:
     """Authentication result model."""
 
@@ -42,6 +44,7 @@ class AuthService:
         self._users = users
         self._auth_events = auth_events
         self._password_hasher = password_hasher
+        self._dummy_password_hash: str | None = None
 
     async def authenticate(
         self,
@@ -54,53 +57,83 @@ class AuthService:
         """Authenticate user credentials and always emit auth event."""
 
         user = await self._users.get_by_email(email=email)
-        if user is None:
-            await self._auth_events.append_event(
-                AuthEventCreateInput(
-                    user_id=None,
-                    event_type="login_failed",
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    payload={"email": email, "reason": "invalid_credentials"},
-                )
-            )
-            return AuthResult(outcome=AuthOutcome.INVALID_CREDENTIALS, user=None)
-
-        if not user.is_active:
-            await self._auth_events.append_event(
-                AuthEventCreateInput(
-                    user_id=user.user_id,
-                    event_type="login_blocked_inactive",
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    payload={"email": email},
-                )
-            )
-            return AuthResult(outcome=AuthOutcome.INACTIVE_USER, user=None)
 
-        is_valid = self._password_hasher.verify_password(
+        # Always run exactly one password verification so unknown, inactive and
+        # wrong-password attempts cost the same and do not leak account state by timing.
+        # Hashing is CPU-bound, so it runs off the event loop to keep other requests moving.
+        password_hash = (
+            user.password_hash if user is not None else await self._get_dummy_password_hash()
+        )
+        is_valid = await asyncio.to_thread(
+            self._password_hasher.verify_password,
             password=password,
-            password_hash=user.password_hash,
+            password_hash=password_hash,
         )
-        if not is_valid:
-            await self._auth_events.append_event(
-                AuthEventCreateInput(
-                    user_id=user.user_id,
-                    event_type="login_failed",
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    payload={"email": email, "reason": "invalid_credentials"},
-                )
-            )
-            return AuthResult(outcome=AuthOutcome.INVALID_CREDENTIALS, user=None)
+
+        if user is None:
+            outcome = AuthOutcome.INVALID_CREDENTIALS
+        elif not user.is_active:
+            outcome = AuthOutcome.INACTIVE_USER
+        elif not is_valid:
+            outcome = AuthOutcome.INVALID_CREDENTIALS
+        else:
+            outcome = AuthOutcome.SUCCESS
 
         await self._auth_events.append_event(
-            AuthEventCreateInput(
-                user_id=user.user_id,
-                event_type="login_success",
+            _build_auth_event(
+                outcome=outcome,
+                user=user,
+                email=email,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                payload={"email": email, "role": user.role.value},
             )
         )
-        return AuthResult(outcome=AuthOutcome.SUCCESS, user=user)
+        if outcome is AuthOutcome.SUCCESS:
+            return AuthResult(outcome=outcome, user=user)
+        return AuthResult(outcome=outcome, user=None)
+
+    async def _get_dummy_password_hash(self) -> str:
+        """Return a per-service hash used to equalize verification work for unknown users."""
+
+        if self._dummy_password_hash is None:
+            self._dummy_password_hash = await asyncio.to_thread(
+                self._password_hasher.hash_password,
+                secrets.token_urlsafe(32),
+            )
+        return self._dummy_password_hash
+
+
+def _build_auth_event(
+    *,
+    outcome: AuthOutcome,
+    user: UserRecord | None,
+    email: str,
+    ip_address: str | None,
+    user_agent: str | None,
+) -> AuthEventCreateInput:
+    """Map one authentication outcome to its auth audit event."""
+
+    user_id = user.user_id if user is not None else None
+    if outcome is AuthOutcome.SUCCESS and user is not None:
+        return AuthEventCreateInput(
+            user_id=user_id,
+            event_type="login_success",
+            ip_address=ip_address,
+            user_agent=user_agent,
+            payload={"email": email, "role": user.role},
+        )
+    if outcome is AuthOutcome.INACTIVE_USER:
+        return AuthEventCreateInput(
+            user_id=user_id,
+            event_type="login_blocked_inactive",
+            ip_address=ip_address,
+            user_agent=user_agent,
+            payload={"email": email},
+        )
+    return AuthEventCreateInput(
+        user_id=user_id,
+        event_type="login_failed",
+        ip_address=ip_address,
+        user_agent=user_agent,
+        payload={"email": email, "reason": "invalid_credentials"},
+    )
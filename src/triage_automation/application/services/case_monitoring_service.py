@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
+from typing import Final
 from uuid import UUID
 
 from triage_automation.application.ports.case_repository_port import (
@@ -14,12 +16,15 @@ from triage_automation.application.ports.case_repository_port import (
 )
 from triage_automation.domain.case_status import CaseStatus
 
+_ONE_DAY: Final[timedelta] = timedelta(days=1)
+_TODAY_CACHE_TTL_SECONDS: Final[float] = 1.0
+
 
 class InvalidMonitoringPeriodError(ValueError):
     """Raised when monitoring period filters are semantically invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CaseMonitoringListQuery:
     """Query object for paginated monitoring list retrieval."""
 
@@ -31,6 +36,17 @@ class CaseMonitoringListQuery:
     tz_offset_minutes: int = 0
 
 
+@dataclass(slots=True)
+class _TodayCache:
+    """Memoized UTC date with its monotonic expiry."""
+
+    expires_at: float = float("-inf")
+    value: date | None = None
+
+
+_TODAY_CACHE = _TodayCache()
+
+
 class CaseMonitoringService:
     """Read monitoring dashboard data (list and per-case detail timelines)."""
 
@@ -46,7 +62,7 @@ class CaseMonitoringService:
         resolved_from_date = query.from_date
         resolved_to_date = query.to_date
         if resolved_from_date is None and resolved_to_date is None:
-            default_date = datetime.now(tz=UTC).date()
+            default_date = _today_utc()
             resolved_from_date = default_date
             resolved_to_date = default_date
 
@@ -76,6 +92,16 @@ class CaseMonitoringService:
         return await self._case_repository.get_case_monitoring_detail(case_id=case_id)
 
 
+def _today_utc() -> date:
+    """Return the current UTC date, re-reading the wall clock at most once per second."""
+
+    now = time.monotonic()
+    if _TODAY_CACHE.value is None or now >= _TODAY_CACHE.expires_at:
+        _TODAY_CACHE.value = datetime.now(tz=UTC).date()
+        _TODAY_CACHE.expires_at = now + _TODAY_CACHE_TTL_SECONDS
+    return _TODAY_CACHE.value
+
+
 def _day_start(value: date, tz_offset_minutes: int = 0) -> datetime:
     """Return UTC start-of-day datetime adjusted for client timezone offset.
 
@@ -94,12 +120,13 @@ def _day_start(value: date, tz_offset_minutes: int = 0) -> datetime:
     """
 
     base = datetime(value.year, value.month, value.day, tzinfo=UTC)
-    adjusted = base - timedelta(minutes=tz_offset_minutes)
-    return adjusted
+    if tz_offset_minutes == 0:
+        return base
+    return base - timedelta(minutes=tz_offset_minutes)
 
 
 def _next_day_start(value: date, tz_offset_minutes: int = 0) -> datetime:
     """Return UTC start-of-next-day datetime adjusted for client timezone offset."""
 
-    return _day_start(value, tz_offset_minutes) + timedelta(days=1)
+    return _day_start(value, tz_offset_minutes) + _ONE_DAY
 
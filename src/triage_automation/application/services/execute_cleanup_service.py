@@ -7,7 +7,7 @@ import json
 import logging
 import re
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 from uuid import UUID
 
@@ -16,10 +16,15 @@ from triage_automation.application.ports.audit_repository_port import (
     AuditRepositoryPort,
 )
 from triage_automation.application.ports.case_repository_port import CaseRepositoryPort
-from triage_automation.application.ports.message_repository_port import MessageRepositoryPort
+from triage_automation.application.ports.message_repository_port import (
+    CaseMessageRef,
+    MessageRepositoryPort,
+)
 
 logger = logging.getLogger(__name__)
 _MIN_RETRY_DELAY_SECONDS = 0.2
+_DEFAULT_MAX_CONCURRENT_REDACTIONS = 8
+_AUDIT_BATCH_SIZE = 500
 _RETRY_AFTER_PATTERN = re.compile(r'"retry_after_ms"\s*:\s*(\d+)', flags=re.IGNORECASE)
 
 
@@ -30,7 +35,7 @@ class MatrixRedactorPort(Protocol):
         """Redact an event in a room."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecuteCleanupResult:
     """Outcome model for cleanup execution job."""
 
@@ -55,6 +60,15 @@ class ExecuteCleanupRetriableError(RuntimeError):
         )
 
 
+@dataclass(slots=True)
+class _CleanupProgress:
+    """Mutable redaction counters and audit buffer shared by cleanup workers."""
+
+    success_count: int = 0
+    failed_count: int = 0
+    pending_events: list[AuditEventCreateInput] = field(default_factory=list)
+
+
 class ExecuteCleanupService:
     """Redact all case messages and finalize cleanup state."""
 
@@ -67,6 +81,7 @@ class ExecuteCleanupService:
         matrix_redactor: MatrixRedactorPort,
         sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
         max_redaction_attempts: int = 5,
+        max_concurrent_redactions: int = _DEFAULT_MAX_CONCURRENT_REDACTIONS,
     ) -> None:
         self._case_repository = case_repository
         self._audit_repository = audit_repository
@@ -74,65 +89,38 @@ class ExecuteCleanupService:
         self._matrix_redactor = matrix_redactor
         self._sleep = sleep
         self._max_redaction_attempts = max(1, max_redaction_attempts)
+        self._max_concurrent_redactions = max(1, max_concurrent_redactions)
 
     async def execute(self, *, case_id: UUID) -> ExecuteCleanupResult:
         """Redact all tracked case messages and mark case CLEANED."""
 
         logger.info("cleanup_started case_id=%s", case_id)
-        refs = await self._message_repository.list_message_refs_for_case(case_id=case_id)
-        logger.info("cleanup_refs_loaded case_id=%s message_refs=%s", case_id, len(refs))
 
-        success_count = 0
-        failed_count = 0
-
-        for ref in refs:
-            try:
-                await self._redact_with_retry(
-                    case_id=case_id,
-                    room_id=ref.room_id,
-                    event_id=ref.event_id,
-                )
-            except Exception as error:  # noqa: BLE001
-                failed_count += 1
-                logger.warning(
-                    "cleanup_redaction_failed case_id=%s room_id=%s event_id=%s error=%s",
-                    case_id,
-                    ref.room_id,
-                    ref.event_id,
-                    error,
-                )
-                await self._audit_repository.append_event(
-                    AuditEventCreateInput(
-                        case_id=case_id,
-                        actor_type="system",
-                        room_id=ref.room_id,
-                        matrix_event_id=ref.event_id,
-                        event_type="MATRIX_EVENT_REDACTION_FAILED",
-                        payload={"error": str(error)},
-                    )
-                )
-                continue
-
-            success_count += 1
-            logger.info(
-                "cleanup_redaction_ok case_id=%s room_id=%s event_id=%s",
-                case_id,
-                ref.room_id,
-                ref.event_id,
-            )
-            await self._audit_repository.append_event(
-                AuditEventCreateInput(
-                    case_id=case_id,
-                    actor_type="system",
-                    room_id=ref.room_id,
-                    matrix_event_id=ref.event_id,
-                    event_type="MATRIX_EVENT_REDACTED",
-                    payload={},
+        queue: asyncio.Queue[CaseMessageRef | None] = asyncio.Queue(
+            maxsize=self._max_concurrent_redactions * 2
+        )
+        progress = _CleanupProgress()
+        tasks = [
+            asyncio.create_task(self._enqueue_message_refs(case_id=case_id, queue=queue)),
+            *(
+                asyncio.create_task(
+                    self._run_redaction_worker(case_id=case_id, queue=queue, progress=progress)
                 )
-            )
+                for _ in range(self._max_concurrent_redactions)
+            ),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        success_count = progress.success_count
+        failed_count = progress.failed_count
+        pending_events = progress.pending_events
 
         if failed_count > 0:
-            await self._audit_repository.append_event(
+            pending_events.append(
                 AuditEventCreateInput(
                     case_id=case_id,
                     actor_type="system",
@@ -143,6 +131,7 @@ class ExecuteCleanupService:
                     },
                 )
             )
+            await self._audit_repository.append_events(pending_events)
             logger.warning(
                 "cleanup_incomplete case_id=%s redacted_success=%s redacted_failed=%s",
                 case_id,
@@ -155,6 +144,7 @@ class ExecuteCleanupService:
                 redacted_failed=failed_count,
             )
 
+        await self._audit_repository.append_events(pending_events)
         await self._case_repository.mark_cleanup_completed(case_id=case_id)
         await self._audit_repository.append_event(
             AuditEventCreateInput(
@@ -179,6 +169,86 @@ class ExecuteCleanupService:
             redacted_failed=failed_count,
         )
 
+    async def _enqueue_message_refs(
+        self,
+        *,
+        case_id: UUID,
+        queue: asyncio.Queue[CaseMessageRef | None],
+    ) -> None:
+        """Stream case message refs into the redaction queue, then stop every worker."""
+
+        async for ref in self._message_repository.iter_message_refs_for_case(case_id=case_id):
+            await queue.put(ref)
+        for _ in range(self._max_concurrent_redactions):
+            await queue.put(None)
+
+    async def _run_redaction_worker(
+        self,
+        *,
+        case_id: UUID,
+        queue: asyncio.Queue[CaseMessageRef | None],
+        progress: _CleanupProgress,
+    ) -> None:
+        """Redact queued refs and buffer their audit events until the queue is drained."""
+
+        while (ref := await queue.get()) is not None:
+            error = await self._redact_ref(case_id=case_id, ref=ref)
+            if error is not None:
+                progress.failed_count += 1
+                progress.pending_events.append(
+                    AuditEventCreateInput(
+                        case_id=case_id,
+                        actor_type="system",
+                        room_id=ref.room_id,
+                        matrix_event_id=ref.event_id,
+                        event_type="MATRIX_EVENT_REDACTION_FAILED",
+                        payload={"error": str(error)},
+                    )
+                )
+            else:
+                progress.success_count += 1
+                progress.pending_events.append(
+                    AuditEventCreateInput(
+                        case_id=case_id,
+                        actor_type="system",
+                        room_id=ref.room_id,
+                        matrix_event_id=ref.event_id,
+                        event_type="MATRIX_EVENT_REDACTED",
+                        payload={},
+                    )
+                )
+            if len(progress.pending_events) >= _AUDIT_BATCH_SIZE:
+                batch, progress.pending_events = progress.pending_events, []
+                await self._audit_repository.append_events(batch)
+
+    async def _redact_ref(self, *, case_id: UUID, ref: CaseMessageRef) -> Exception | None:
+        """Redact one Matrix event and return its error instead of raising."""
+
+        try:
+            await self._redact_with_retry(
+                case_id=case_id,
+                room_id=ref.room_id,
+                event_id=ref.event_id,
+            )
+        except Exception as error:  # noqa: BLE001
+            logger.warning(
+                "cleanup_redaction_failed case_id=%s room_id=%s event_id=%s error=%s",
+                case_id,
+                ref.room_id,
+                ref.event_id,
+                error,
+            )
+            return error
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "cleanup_redaction_ok case_id=%s room_id=%s event_id=%s",
+                case_id,
+                ref.room_id,
+                ref.event_id,
+            )
+        return None
+
     async def _redact_with_retry(
         self,
         *,
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Any, Protocol
+from typing import Any, Final, Protocol
 
 from triage_automation.application.dto.webhook_models import TriageDecisionWebhookPayload
 from triage_automation.application.ports.audit_repository_port import (
@@ -27,13 +29,18 @@ from triage_automation.application.ports.reaction_checkpoint_repository_port imp
     ReactionCheckpointRepositoryPort,
 )
 from triage_automation.application.services.patient_context import extract_patient_name_age
-from triage_automation.domain.case_status import CaseStatus
 from triage_automation.infrastructure.matrix.message_templates import (
     build_room2_decision_ack_message,
 )
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_NEXT_JOB_TYPE: Final[str] = "post_room3_request"
+_NEXT_JOB_TYPE_BY_DECISION: Final[dict[str, str]] = {
+    "accept": _DEFAULT_NEXT_JOB_TYPE,
+    "deny": "post_room1_final_denial_triage",
+}
+
 
 class HandleDoctorDecisionOutcome(StrEnum):
     """Outcomes returned by decision callback handling service."""
@@ -44,7 +51,7 @@ class HandleDoctorDecisionOutcome(StrEnum):
     DUPLICATE_OR_RACE = "duplicate_or_race"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandleDoctorDecisionResult:
     """Service outcome model for webhook API response mapping."""
 
@@ -78,9 +85,15 @@ class HandleDoctorDecisionService:
         self._case_repository = case_repository
         self._audit_repository = audit_repository
         self._job_queue = job_queue
-        self._message_repository = message_repository
-        self._matrix_poster = matrix_poster
-        self._room2_id = room2_id
+        self._room2_ack_target: (
+            tuple[MessageRepositoryPort, MatrixRoomDecisionPosterPort, str] | None
+        ) = (
+            (message_repository, matrix_poster, room2_id)
+            if message_repository is not None
+            and matrix_poster is not None
+            and room2_id is not None
+            else None
+        )
         self._reaction_checkpoint_repository = reaction_checkpoint_repository
 
     async def handle(
@@ -99,33 +112,7 @@ class HandleDoctorDecisionService:
             payload.decision,
             payload.support_flag,
         )
-        snapshot = await self._case_repository.get_case_doctor_decision_snapshot(
-            case_id=payload.case_id
-        )
-        if snapshot is None:
-            logger.info("doctor_decision_ignored_not_found case_id=%s", payload.case_id)
-            return HandleDoctorDecisionResult(outcome=HandleDoctorDecisionOutcome.NOT_FOUND)
-
-        if snapshot.status != CaseStatus.WAIT_DOCTOR:
-            await self._audit_repository.append_event(
-                AuditEventCreateInput(
-                    case_id=payload.case_id,
-                    actor_type="system",
-                    event_type="ROOM2_DECISION_IGNORED_WRONG_STATE",
-                    payload={
-                        "current_status": snapshot.status.value,
-                        "decision": payload.decision,
-                    },
-                )
-            )
-            logger.info(
-                "doctor_decision_ignored_wrong_state case_id=%s current_status=%s",
-                payload.case_id,
-                snapshot.status.value,
-            )
-            return HandleDoctorDecisionResult(outcome=HandleDoctorDecisionOutcome.WRONG_STATE)
-
-        applied = await self._case_repository.apply_doctor_decision_if_waiting(
+        result = await self._case_repository.apply_doctor_decision(
             DoctorDecisionUpdateInput(
                 case_id=payload.case_id,
                 doctor_user_id=payload.doctor_user_id,
@@ -134,20 +121,46 @@ class HandleDoctorDecisionService:
                 reason=payload.reason,
             )
         )
-        if not applied:
-            await self._audit_repository.append_event(
-                AuditEventCreateInput(
-                    case_id=payload.case_id,
-                    actor_type="system",
-                    event_type="ROOM2_DECISION_DUPLICATE_OR_RACE_IGNORED",
-                    payload={"decision": payload.decision},
+        match result.outcome:
+            case "not_found":
+                logger.info("doctor_decision_ignored_not_found case_id=%s", payload.case_id)
+                return HandleDoctorDecisionResult(outcome=HandleDoctorDecisionOutcome.NOT_FOUND)
+            case "wrong_state":
+                current_status = result.current_status
+                await self._audit_repository.append_event(
+                    AuditEventCreateInput(
+                        case_id=payload.case_id,
+                        actor_type="system",
+                        event_type="ROOM2_DECISION_IGNORED_WRONG_STATE",
+                        payload={
+                            "current_status": current_status,
+                            "decision": payload.decision,
+                        },
+                    )
+                )
+                logger.info(
+                    "doctor_decision_ignored_wrong_state case_id=%s current_status=%s",
+                    payload.case_id,
+                    current_status,
+                )
+                return HandleDoctorDecisionResult(
+                    outcome=HandleDoctorDecisionOutcome.WRONG_STATE
+                )
+            case "duplicate":
+                await self._audit_repository.append_event(
+                    AuditEventCreateInput(
+                        case_id=payload.case_id,
+                        actor_type="system",
+                        event_type="ROOM2_DECISION_DUPLICATE_OR_RACE_IGNORED",
+                        payload={"decision": payload.decision},
+                    )
+                )
+                return HandleDoctorDecisionResult(
+                    outcome=HandleDoctorDecisionOutcome.DUPLICATE_OR_RACE
                 )
-            )
-            return HandleDoctorDecisionResult(
-                outcome=HandleDoctorDecisionOutcome.DUPLICATE_OR_RACE
-            )
 
-        await self._audit_repository.append_event(
+        job_type = _next_job_type(payload.decision)
+        pending_events = [
             AuditEventCreateInput(
                 case_id=payload.case_id,
                 actor_type="system",
@@ -157,40 +170,44 @@ class HandleDoctorDecisionService:
                     "decision": payload.decision,
                     "support_flag": payload.support_flag,
                     "reason": payload.reason,
-                    "submitted_at": (
-                        payload.submitted_at.isoformat()
-                        if payload.submitted_at is not None
-                        else None
-                    ),
+                    "submitted_at": payload.submitted_at_iso,
                     "widget_event_id": payload.widget_event_id,
                 },
             )
+        ]
+        # The next-step job and the Room-2 ack only depend on the applied decision, so
+        # they run concurrently; failures are re-raised after the audit batch is written.
+        enqueue_outcome, ack_outcome = await asyncio.gather(
+            self._job_queue.enqueue(
+                JobEnqueueInput(case_id=payload.case_id, job_type=job_type, payload={})
+            ),
+            self._post_room2_decision_ack(
+                payload=payload,
+                agency_record_number=result.agency_record_number,
+                structured_data_json=result.structured_data_json,
+            ),
+            return_exceptions=True,
         )
-
-        job_type = _next_job_type(payload.decision)
-        await self._job_queue.enqueue(
-            JobEnqueueInput(case_id=payload.case_id, job_type=job_type, payload={})
-        )
-        logger.info(
-            "doctor_decision_applied case_id=%s next_job=%s",
-            payload.case_id,
-            job_type,
-        )
-
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=payload.case_id,
-                actor_type="system",
-                event_type="JOB_ENQUEUED_NEXT_STEP",
-                payload={"job_type": job_type, "decision": payload.decision},
+        if not isinstance(enqueue_outcome, BaseException):
+            logger.info(
+                "doctor_decision_applied case_id=%s next_job=%s",
+                payload.case_id,
+                job_type,
             )
-        )
-
-        await self._post_room2_decision_ack(
-            payload=payload,
-            agency_record_number=snapshot.agency_record_number,
-            structured_data_json=snapshot.structured_data_json,
-        )
+            pending_events.append(
+                AuditEventCreateInput(
+                    case_id=payload.case_id,
+                    actor_type="system",
+                    event_type="JOB_ENQUEUED_NEXT_STEP",
+                    payload={"job_type": job_type, "decision": payload.decision},
+                )
+            )
+        if not isinstance(ack_outcome, BaseException):
+            pending_events.extend(ack_outcome)
+        await self._audit_repository.append_events(pending_events)
+        for outcome in (enqueue_outcome, ack_outcome):
+            if isinstance(outcome, BaseException):
+                raise outcome
 
         return HandleDoctorDecisionResult(outcome=HandleDoctorDecisionOutcome.APPLIED)
 
@@ -200,15 +217,12 @@ class HandleDoctorDecisionService:
         payload: TriageDecisionWebhookPayload,
         agency_record_number: str | None,
         structured_data_json: dict[str, Any] | None,
-    ) -> None:
-        """Post and persist Room-2 decision acknowledgment target when configured."""
+    ) -> list[AuditEventCreateInput]:
+        """Post and persist Room-2 decision ack, returning its audit events for batching."""
 
-        if (
-            self._message_repository is None
-            or self._matrix_poster is None
-            or self._room2_id is None
-        ):
-            return
+        if self._room2_ack_target is None:
+            return []
+        message_repository, matrix_poster, room2_id = self._room2_ack_target
 
         patient_name, _ = extract_patient_name_age(structured_data_json)
         body = build_room2_decision_ack_message(
@@ -222,14 +236,14 @@ class HandleDoctorDecisionService:
         related_event_id = payload.widget_event_id
         try:
             if related_event_id is not None:
-                ack_event_id = await self._matrix_poster.reply_text(
-                    room_id=self._room2_id,
+                ack_event_id = await matrix_poster.reply_text(
+                    room_id=room2_id,
                     event_id=related_event_id,
                     body=body,
                 )
             else:
-                ack_event_id = await self._matrix_poster.send_text(
-                    room_id=self._room2_id,
+                ack_event_id = await matrix_poster.send_text(
+                    room_id=room2_id,
                     body=body,
                 )
         except Exception as exc:  # pragma: no cover - defensive resilience path
@@ -238,58 +252,60 @@ class HandleDoctorDecisionService:
                 payload.case_id,
                 exc,
             )
-            await self._audit_repository.append_event(
+            return [
                 AuditEventCreateInput(
                     case_id=payload.case_id,
                     actor_type="system",
                     event_type="ROOM2_DECISION_ACK_POST_FAILED",
                     payload={"error": str(exc)},
                 )
-            )
-            return
+            ]
 
-        await self._message_repository.add_message(
-            CaseMessageCreateInput(
-                case_id=payload.case_id,
-                room_id=self._room2_id,
-                event_id=ack_event_id,
-                sender_user_id=None,
-                kind="room2_decision_ack",
-            )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
-            CaseMatrixMessageTranscriptCreateInput(
-                case_id=payload.case_id,
-                room_id=self._room2_id,
-                event_id=ack_event_id,
-                sender="bot",
-                message_type="room2_decision_ack",
-                message_text=body,
-                reply_to_event_id=related_event_id,
+        # Message mapping and transcript share one transaction; the reaction checkpoint
+        # is an independent row keyed by the ack event id, so it is written concurrently.
+        persist_writes: list[Awaitable[object]] = [
+            message_repository.add_message_with_transcript(
+                CaseMessageCreateInput(
+                    case_id=payload.case_id,
+                    room_id=room2_id,
+                    event_id=ack_event_id,
+                    sender_user_id=None,
+                    kind="room2_decision_ack",
+                ),
+                CaseMatrixMessageTranscriptCreateInput(
+                    case_id=payload.case_id,
+                    room_id=room2_id,
+                    event_id=ack_event_id,
+                    sender="bot",
+                    message_type="room2_decision_ack",
+                    message_text=body,
+                    reply_to_event_id=related_event_id,
+                ),
+            ),
+        ]
+        if self._reaction_checkpoint_repository is not None:
+            persist_writes.append(
+                self._reaction_checkpoint_repository.ensure_expected_checkpoint(
+                    ReactionCheckpointCreateInput(
+                        case_id=payload.case_id,
+                        stage="ROOM2_ACK",
+                        room_id=room2_id,
+                        target_event_id=ack_event_id,
+                    )
+                )
             )
-        )
-        await self._audit_repository.append_event(
+        await asyncio.gather(*persist_writes)
+        return [
             AuditEventCreateInput(
                 case_id=payload.case_id,
                 actor_type="bot",
-                room_id=self._room2_id,
+                room_id=room2_id,
                 matrix_event_id=ack_event_id,
                 event_type="ROOM2_DECISION_ACK_POSTED",
                 payload={"related_event_id": related_event_id},
             )
-        )
-        if self._reaction_checkpoint_repository is not None:
-            await self._reaction_checkpoint_repository.ensure_expected_checkpoint(
-                ReactionCheckpointCreateInput(
-                    case_id=payload.case_id,
-                    stage="ROOM2_ACK",
-                    room_id=self._room2_id,
-                    target_event_id=ack_event_id,
-                )
-            )
+        ]
 
 
 def _next_job_type(decision: str) -> str:
-    if decision == "deny":
-        return "post_room1_final_denial_triage"
-    return "post_room3_request"
+    return _NEXT_JOB_TYPE_BY_DECISION.get(decision, _DEFAULT_NEXT_JOB_TYPE)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 from uuid import UUID
 
 from pydantic import ValidationError
@@ -15,7 +15,7 @@ from triage_automation.application.ports.case_repository_port import (
 )
 from triage_automation.application.services.llm_json_parser import (
     LlmJsonParseError,
-    decode_llm_json_object,
+    decode_and_validate_llm_json,
 )
 from triage_automation.application.services.prompt_template_service import (
     PROMPT_NAME_LLM1_SYSTEM,
@@ -25,11 +25,25 @@ from triage_automation.application.services.prompt_template_service import (
 )
 from triage_automation.application.services.ptbr_language_guard import (
     collect_forbidden_terms,
+    has_forbidden_terms,
 )
 from triage_automation.infrastructure.llm.llm_client import LlmClientPort
 
+_DEFAULT_SYSTEM_PROMPT: Final[str] = (
+    "Voce e um assistente clinico para triagem de Endoscopia Digestiva Alta (EDA). "
+    "Retorne APENAS JSON valido que siga estritamente o schema_version 1.1. "
+    "Escreva todos os campos narrativos em portugues brasileiro (pt-BR). "
+    "Nao use palavras em ingles nos campos narrativos. "
+    "Nao inclua markdown, blocos de codigo ou chaves extras. "
+    "Nao invente fatos; use null/unknown quando faltar informacao."
+)
+_DEFAULT_USER_PROMPT_TEMPLATE: Final[str] = (
+    "Tarefa: extrair dados estruturados e gerar resumo conciso de triagem "
+    "a partir de um relatorio clinico para triagem EDA."
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Llm1ServiceResult:
     """Validated and normalized LLM1 artifacts for persistence."""
 
@@ -69,6 +83,7 @@ class Llm1Service:
         user_prompt_name: str = PROMPT_NAME_LLM1_USER,
     ) -> None:
         self._llm_client = llm_client
+        self._model_name = _resolve_model_name(llm_client)
         self._prompt_templates = prompt_templates
         self._system_prompt_name = system_prompt_name
         self._user_prompt_name = user_prompt_name
@@ -113,8 +128,7 @@ class Llm1Service:
             agency_record_number=agency_record_number,
         )
 
-        forbidden_terms = _collect_llm1_forbidden_terms(validated=validated)
-        if forbidden_terms:
+        if has_forbidden_terms(texts=_llm1_narrative_texts(validated=validated)):
             retry_user_prompt = (
                 f"{user_prompt}\n\n"
                 f"{self._LANGUAGE_RETRY_INSTRUCTION}"
@@ -133,9 +147,9 @@ class Llm1Service:
                 raw_response=retry_response,
                 agency_record_number=agency_record_number,
             )
-            forbidden_terms = _collect_llm1_forbidden_terms(validated=validated)
-            if forbidden_terms:
-                joined_terms = ", ".join(forbidden_terms)
+            narrative_texts = _llm1_narrative_texts(validated=validated)
+            if has_forbidden_terms(texts=narrative_texts):
+                joined_terms = ", ".join(collect_forbidden_terms(texts=narrative_texts))
                 raise Llm1RetriableError(
                     cause="llm1",
                     details=(
@@ -184,7 +198,7 @@ class Llm1Service:
                     prompt_system_version=prompt_system_version,
                     prompt_user_name=prompt_user_name,
                     prompt_user_version=prompt_user_version,
-                    model_name=_resolve_model_name(self._llm_client),
+                    model_name=self._model_name,
                 )
             )
         return raw_response
@@ -192,8 +206,8 @@ class Llm1Service:
     async def _load_prompts(self) -> tuple[str, str, str, int, str, int]:
         if self._prompt_templates is None:
             return (
-                _default_system_prompt(),
-                _default_user_prompt_template(),
+                _DEFAULT_SYSTEM_PROMPT,
+                _DEFAULT_USER_PROMPT_TEMPLATE,
                 self._system_prompt_name,
                 0,
                 self._user_prompt_name,
@@ -218,24 +232,6 @@ class Llm1Service:
         )
 
 
-def _default_system_prompt() -> str:
-    return (
-        "Voce e um assistente clinico para triagem de Endoscopia Digestiva Alta (EDA). "
-        "Retorne APENAS JSON valido que siga estritamente o schema_version 1.1. "
-        "Escreva todos os campos narrativos em portugues brasileiro (pt-BR). "
-        "Nao use palavras em ingles nos campos narrativos. "
-        "Nao inclua markdown, blocos de codigo ou chaves extras. "
-        "Nao invente fatos; use null/unknown quando faltar informacao."
-    )
-
-
-def _default_user_prompt_template() -> str:
-    return (
-        "Tarefa: extrair dados estruturados e gerar resumo conciso de triagem "
-        "a partir de um relatorio clinico para triagem EDA."
-    )
-
-
 def _render_user_prompt(
     *,
     template: str,
@@ -260,15 +256,12 @@ def _decode_and_validate_llm1_response(
     agency_record_number: str,
 ) -> Llm1Response:
     try:
-        decoded = decode_llm_json_object(raw_response)
+        validated = decode_and_validate_llm_json(raw_response, Llm1Response)
     except LlmJsonParseError as error:
         raise Llm1RetriableError(
             cause="llm1",
             details="LLM1 returned non-JSON payload",
         ) from error
-
-    try:
-        validated = Llm1Response.model_validate(decoded)
     except ValidationError as error:
         raise Llm1RetriableError(
             cause="llm1",
@@ -284,7 +277,7 @@ def _decode_and_validate_llm1_response(
     return validated
 
 
-def _collect_llm1_forbidden_terms(*, validated: Llm1Response) -> list[str]:
+def _llm1_narrative_texts(*, validated: Llm1Response) -> list[str]:
     texts: list[str] = [
         validated.summary.one_liner,
         *validated.summary.bullet_points,
@@ -296,7 +289,7 @@ def _collect_llm1_forbidden_terms(*, validated: Llm1Response) -> list[str]:
         validated.eda.cardiovascular_risk.rationale,
     ]
     texts.extend(text for text in optional_texts if text is not None)
-    return collect_forbidden_terms(texts=texts)
+    return texts
 
 
 def _build_llm_input_payload(*, system_prompt: str, user_prompt: str) -> dict[str, Any]:
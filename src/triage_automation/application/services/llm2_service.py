@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 from uuid import UUID
 
 from pydantic import ValidationError
 
-from triage_automation.application.dto.llm1_models import Llm1Response
+from triage_automation.application.dto.llm1_models import Llm1Eda, Llm1PolicyPrecheck
 from triage_automation.application.dto.llm2_models import Llm2Response
 from triage_automation.application.ports.case_repository_port import (
     CaseLlmInteractionCreateInput,
@@ -17,7 +19,7 @@ from triage_automation.application.ports.case_repository_port import (
 )
 from triage_automation.application.services.llm_json_parser import (
     LlmJsonParseError,
-    decode_llm_json_object,
+    decode_and_validate_llm_json,
 )
 from triage_automation.application.services.prompt_template_service import (
     PROMPT_NAME_LLM2_SYSTEM,
@@ -27,6 +29,7 @@ from triage_automation.application.services.prompt_template_service import (
 )
 from triage_automation.application.services.ptbr_language_guard import (
     collect_forbidden_terms,
+    has_forbidden_terms,
 )
 from triage_automation.domain.policy.eda_policy import (
     EdaPolicyPrecheckInput,
@@ -36,8 +39,23 @@ from triage_automation.domain.policy.eda_policy import (
 )
 from triage_automation.infrastructure.llm.llm_client import LlmClientPort
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+_DEFAULT_SYSTEM_PROMPT: Final[str] = (
+    "Voce e um assistente de apoio a decisao clinica para triagem de Endoscopia "
+    "Digestiva Alta (EDA). Retorne APENAS JSON valido que siga estritamente "
+    "o schema_version 1.1. Escreva todos os campos narrativos em portugues "
+    "brasileiro (pt-BR). Nao use palavras em ingles nos campos narrativos. "
+    "Use apenas valores de enum permitidos para suggestion e support_recommendation. "
+    "Nao inclua markdown, blocos de codigo ou chaves extras."
+)
+_DEFAULT_USER_PROMPT_TEMPLATE: Final[str] = (
+    "Tarefa: sugerir accept/deny e recomendacao de suporte para triagem EDA "
+    "usando dados estruturados do LLM1 e contexto de caso anterior."
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Llm2ServiceResult:
     """Validated and policy-reconciled LLM2 artifact for persistence."""
 
@@ -77,6 +95,7 @@ class Llm2Service:
         user_prompt_name: str = PROMPT_NAME_LLM2_USER,
     ) -> None:
         self._llm_client = llm_client
+        self._model_name = _resolve_model_name(llm_client)
         self._prompt_templates = prompt_templates
         self._system_prompt_name = system_prompt_name
         self._user_prompt_name = user_prompt_name
@@ -92,13 +111,55 @@ class Llm2Service:
     ) -> Llm2ServiceResult:
         """Execute LLM2 and return policy-reconciled suggestion artifacts."""
 
+        pending_captures: list[asyncio.Task[None]] = []
+        run_error: BaseException | None = None
         try:
-            llm1_payload = Llm1Response.model_validate(llm1_structured_data)
-        except ValidationError as error:
-            raise Llm2RetriableError(
-                cause="llm2",
-                details=f"LLM1 payload invalid for LLM2 input: {error}",
-            ) from error
+            return await self._run(
+                case_id=case_id,
+                agency_record_number=agency_record_number,
+                llm1_structured_data=llm1_structured_data,
+                prior_case_json=prior_case_json,
+                interaction_repository=interaction_repository,
+                pending_captures=pending_captures,
+            )
+        except BaseException as error:
+            run_error = error
+            raise
+        finally:
+            # Interaction rows are written in the background while the response is
+            # validated, but always settle before run() returns or raises. A failed
+            # capture fails an otherwise successful run, as the inline write in LLM1
+            # does; when the run already failed, its own error is kept and the capture
+            # failure is logged.
+            if pending_captures:
+                capture_errors = [
+                    outcome
+                    for outcome in await asyncio.gather(
+                        *pending_captures,
+                        return_exceptions=True,
+                    )
+                    if isinstance(outcome, BaseException)
+                ]
+                if capture_errors and run_error is None:
+                    raise capture_errors[0]
+                for capture_error in capture_errors:
+                    logger.warning(
+                        "llm2_interaction_capture_failed case_id=%s error=%r",
+                        case_id,
+                        capture_error,
+                    )
+
+    async def _run(
+        self,
+        *,
+        case_id: UUID,
+        agency_record_number: str,
+        llm1_structured_data: dict[str, object],
+        prior_case_json: dict[str, object] | None,
+        interaction_repository: CaseRepositoryPort | None,
+        pending_captures: list[asyncio.Task[None]],
+    ) -> Llm2ServiceResult:
+        precheck = _precheck_from_llm1(llm1_structured_data)
 
         (
             system_prompt,
@@ -108,9 +169,10 @@ class Llm2Service:
             user_prompt_name,
             user_prompt_version,
         ) = await self._load_prompts()
+        case_id_text = str(case_id)
         user_prompt = _render_user_prompt(
             template=user_prompt_template,
-            case_id=case_id,
+            case_id_text=case_id_text,
             agency_record_number=agency_record_number,
             llm1_structured_data=llm1_structured_data,
             prior_case_json=prior_case_json,
@@ -125,15 +187,15 @@ class Llm2Service:
             prompt_user_name=user_prompt_name,
             prompt_user_version=user_prompt_version,
             interaction_repository=interaction_repository,
+            pending_captures=pending_captures,
         )
         validated = _decode_and_validate_llm2_response(
             raw_response=raw_response,
-            case_id=case_id,
+            case_id_text=case_id_text,
             agency_record_number=agency_record_number,
         )
 
-        forbidden_terms = _collect_llm2_forbidden_terms(validated=validated)
-        if forbidden_terms:
+        if has_forbidden_terms(texts=_llm2_narrative_texts(validated=validated)):
             retry_user_prompt = (
                 f"{user_prompt}\n\n"
                 f"{self._LANGUAGE_RETRY_INSTRUCTION}"
@@ -147,15 +209,16 @@ class Llm2Service:
                 prompt_user_name=user_prompt_name,
                 prompt_user_version=user_prompt_version,
                 interaction_repository=interaction_repository,
+                pending_captures=pending_captures,
             )
             validated = _decode_and_validate_llm2_response(
                 raw_response=retry_response,
-                case_id=case_id,
+                case_id_text=case_id_text,
                 agency_record_number=agency_record_number,
             )
-            forbidden_terms = _collect_llm2_forbidden_terms(validated=validated)
-            if forbidden_terms:
-                joined_terms = ", ".join(forbidden_terms)
+            narrative_texts = _llm2_narrative_texts(validated=validated)
+            if has_forbidden_terms(texts=narrative_texts):
+                joined_terms = ", ".join(collect_forbidden_terms(texts=narrative_texts))
                 raise Llm2RetriableError(
                     cause="llm2",
                     details=(
@@ -165,15 +228,7 @@ class Llm2Service:
                 )
 
         policy_result = reconcile_eda_policy(
-            precheck=EdaPolicyPrecheckInput(
-                excluded_from_eda_flow=llm1_payload.policy_precheck.excluded_from_eda_flow,
-                indication_category=llm1_payload.eda.indication_category,
-                labs_required=llm1_payload.policy_precheck.labs_required,
-                labs_pass=llm1_payload.policy_precheck.labs_pass,
-                ecg_required=llm1_payload.policy_precheck.ecg_required,
-                ecg_present=llm1_payload.policy_precheck.ecg_present,
-                pediatric_flag=llm1_payload.policy_precheck.pediatric_flag,
-            ),
+            precheck=precheck,
             llm2=Llm2SuggestionInput(
                 suggestion=validated.suggestion,
                 policy_alignment=Llm2PolicyAlignmentInput(
@@ -226,13 +281,14 @@ class Llm2Service:
         prompt_user_name: str,
         prompt_user_version: int,
         interaction_repository: CaseRepositoryPort | None,
+        pending_captures: list[asyncio.Task[None]],
     ) -> str:
         raw_response = await self._llm_client.complete(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
         )
         if interaction_repository is not None:
-            await interaction_repository.append_case_llm_interaction(
+            capture = interaction_repository.append_case_llm_interaction(
                 CaseLlmInteractionCreateInput(
                     case_id=case_id,
                     stage="LLM2",
@@ -245,16 +301,17 @@ class Llm2Service:
                     prompt_system_version=prompt_system_version,
                     prompt_user_name=prompt_user_name,
                     prompt_user_version=prompt_user_version,
-                    model_name=_resolve_model_name(self._llm_client),
+                    model_name=self._model_name,
                 )
             )
+            pending_captures.append(asyncio.create_task(capture))
         return raw_response
 
     async def _load_prompts(self) -> tuple[str, str, str, int, str, int]:
         if self._prompt_templates is None:
             return (
-                _default_system_prompt(),
-                _default_user_prompt_template(),
+                _DEFAULT_SYSTEM_PROMPT,
+                _DEFAULT_USER_PROMPT_TEMPLATE,
                 self._system_prompt_name,
                 0,
                 self._user_prompt_name,
@@ -279,28 +336,44 @@ class Llm2Service:
         )
 
 
-def _default_system_prompt() -> str:
-    return (
-        "Voce e um assistente de apoio a decisao clinica para triagem de Endoscopia "
-        "Digestiva Alta (EDA). Retorne APENAS JSON valido que siga estritamente "
-        "o schema_version 1.1. Escreva todos os campos narrativos em portugues "
-        "brasileiro (pt-BR). Nao use palavras em ingles nos campos narrativos. "
-        "Use apenas valores de enum permitidos para suggestion e support_recommendation. "
-        "Nao inclua markdown, blocos de codigo ou chaves extras."
-    )
+def _precheck_from_llm1(llm1_structured_data: dict[str, object]) -> EdaPolicyPrecheckInput:
+    """Build policy precheck input from the LLM1 sections read by policy reconciliation.
 
+    Only `policy_precheck` and `eda` are validated, so the rest of the stored LLM1
+    payload is not walked again, but malformed values in those sections are rejected.
+    """
 
-def _default_user_prompt_template() -> str:
-    return (
-        "Tarefa: sugerir accept/deny e recomendacao de suporte para triagem EDA "
-        "usando dados estruturados do LLM1 e contexto de caso anterior."
+    try:
+        policy_precheck = Llm1PolicyPrecheck.model_validate(
+            llm1_structured_data["policy_precheck"]
+        )
+        eda = Llm1Eda.model_validate(llm1_structured_data["eda"])
+    except KeyError as error:
+        raise Llm2RetriableError(
+            cause="llm2",
+            details=f"LLM1 payload invalid for LLM2 input: missing {error}",
+        ) from error
+    except ValidationError as error:
+        raise Llm2RetriableError(
+            cause="llm2",
+            details=f"LLM1 payload invalid for LLM2 input: {error}",
+        ) from error
+
+    return EdaPolicyPrecheckInput(
+        excluded_from_eda_flow=policy_precheck.excluded_from_eda_flow,
+        indication_category=eda.indication_category,
+        labs_required=policy_precheck.labs_required,
+        labs_pass=policy_precheck.labs_pass,
+        ecg_required=policy_precheck.ecg_required,
+        ecg_present=policy_precheck.ecg_present,
+        pediatric_flag=policy_precheck.pediatric_flag,
     )
 
 
 def _render_user_prompt(
     *,
     template: str,
-    case_id: UUID,
+    case_id_text: str,
     agency_record_number: str,
     llm1_structured_data: dict[str, object],
     prior_case_json: dict[str, object] | None,
@@ -312,7 +385,7 @@ def _render_user_prompt(
     llm1_json = json.dumps(llm1_structured_data, ensure_ascii=False)
     return (
         f"{template}\n\n"
-        f"case_id: {case_id}\n"
+        f"case_id: {case_id_text}\n"
         f"agency_record_number: {agency_record_number}\n\n"
         f"Dados extraídos (JSON LLM1):\n{llm1_json}\n\n"
         f"Decisão anterior (se houver):\n{prior_case}\n\n"
@@ -325,26 +398,23 @@ def _render_user_prompt(
 def _decode_and_validate_llm2_response(
     *,
     raw_response: str,
-    case_id: UUID,
+    case_id_text: str,
     agency_record_number: str,
 ) -> Llm2Response:
     try:
-        decoded = decode_llm_json_object(raw_response)
+        validated = decode_and_validate_llm_json(raw_response, Llm2Response)
     except LlmJsonParseError as error:
         raise Llm2RetriableError(
             cause="llm2",
             details="LLM2 returned non-JSON payload",
         ) from error
-
-    try:
-        validated = Llm2Response.model_validate(decoded)
     except ValidationError as error:
         raise Llm2RetriableError(
             cause="llm2",
             details=f"LLM2 schema validation failed: {error}",
         ) from error
 
-    if validated.case_id != str(case_id):
+    if validated.case_id != case_id_text:
         raise Llm2RetriableError(
             cause="llm2",
             details="LLM2 case_id mismatch",
@@ -359,7 +429,7 @@ def _decode_and_validate_llm2_response(
     return validated
 
 
-def _collect_llm2_forbidden_terms(*, validated: Llm2Response) -> list[str]:
+def _llm2_narrative_texts(*, validated: Llm2Response) -> list[str]:
     texts: list[str] = [
         validated.rationale.short_reason,
         *validated.rationale.details,
@@ -367,7 +437,7 @@ def _collect_llm2_forbidden_terms(*, validated: Llm2Response) -> list[str]:
     ]
     if validated.policy_alignment.notes is not None:
         texts.append(validated.policy_alignment.notes)
-    return collect_forbidden_terms(texts=texts)
+    return texts
 
 
 def _build_llm_input_payload(*, system_prompt: str, user_prompt: str) -> dict[str, Any]:
@@ -6,10 +6,13 @@ import json
 import re
 from typing import cast
 
+from pydantic import BaseModel, ValidationError
+
 _FENCED_JSON_PATTERN = re.compile(
     r"```(?:json)?\s*(\{[\s\S]*\})\s*```",
     flags=re.IGNORECASE,
 )
+_JSON_DECODER = json.JSONDecoder()
 
 
 class LlmJsonParseError(ValueError):
@@ -42,11 +45,36 @@ def decode_llm_json_object(raw_response: str) -> dict[str, object]:
     raise LlmJsonParseError("No valid JSON object found in LLM response")
 
 
+def decode_and_validate_llm_json[ModelT: BaseModel](
+    raw_response: str,
+    model: type[ModelT],
+) -> ModelT:
+    """Parse and validate model output in one pass, falling back to tolerant decoding.
+
+    Raises `LlmJsonParseError` when no JSON object can be recovered and pydantic's
+    `ValidationError` when the recovered object does not match `model`.
+    """
+
+    try:
+        return model.model_validate_json(raw_response)
+    except ValidationError as error:
+        if not _is_unparseable_json_root(error):
+            raise
+    return model.model_validate(decode_llm_json_object(raw_response))
+
+
+def _is_unparseable_json_root(error: ValidationError) -> bool:
+    return any(
+        detail["type"] == "json_invalid" or (not detail["loc"] and detail["type"] == "model_type")
+        for detail in error.errors()
+    )
+
+
 def _decode_json_object(text: str) -> dict[str, object] | None:
     if not text:
         return None
     try:
-        decoded = json.loads(text)
+        decoded = _JSON_DECODER.decode(text)
     except json.JSONDecodeError:
         return None
     if not isinstance(decoded, dict):
@@ -62,15 +90,13 @@ def _extract_fenced_json(raw_response: str) -> str | None:
 
 
 def _extract_first_embedded_json_object(raw_response: str) -> dict[str, object] | None:
-    decoder = json.JSONDecoder()
-    for index, value in enumerate(raw_response):
-        if value != "{":
-            continue
-        fragment = raw_response[index:]
+    index = raw_response.find("{")
+    while index != -1:
         try:
-            decoded, _ = decoder.raw_decode(fragment)
+            decoded, _ = _JSON_DECODER.raw_decode(raw_response, index)
         except json.JSONDecodeError:
-            continue
+            decoded = None
         if isinstance(decoded, dict):
             return cast("dict[str, object]", decoded)
+        index = raw_response.find("{", index + 1)
     return None
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Final, Protocol
 from uuid import UUID
 
 from triage_automation.application.ports.audit_repository_port import (
@@ -57,7 +58,7 @@ class PostRoom1FinalRetriableError(RuntimeError):
         return f"{self.cause}: {self.details}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostRoom1FinalResult:
     """Outcome model for final Room-1 reply posting."""
 
@@ -132,16 +133,14 @@ class PostRoom1FinalService:
             logger.info("room1_final_post_skipped case_id=%s reason=race_already_posted", case_id)
             return PostRoom1FinalResult(posted=False, reason="race_already_posted")
 
-        await self._message_repository.add_message(
+        await self._message_repository.add_message_with_transcript(
             CaseMessageCreateInput(
                 case_id=case_id,
                 room_id=case.room1_origin_room_id,
                 event_id=event_id,
                 sender_user_id=None,
                 kind="room1_final",
-            )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
+            ),
             CaseMatrixMessageTranscriptCreateInput(
                 case_id=case_id,
                 room_id=case.room1_origin_room_id,
@@ -150,7 +149,7 @@ class PostRoom1FinalService:
                 message_type="room1_final",
                 message_text=body,
                 reply_to_event_id=case.room1_origin_event_id,
-            )
+            ),
         )
         if self._reaction_checkpoint_repository is not None:
             await self._reaction_checkpoint_repository.ensure_expected_checkpoint(
@@ -162,26 +161,26 @@ class PostRoom1FinalService:
                 )
             )
 
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=case_id,
-                actor_type="bot",
-                room_id=case.room1_origin_room_id,
-                matrix_event_id=event_id,
-                event_type="ROOM1_FINAL_REPLY_POSTED",
-                payload={"job_type": job_type},
-            )
-        )
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=case_id,
-                actor_type="system",
-                event_type="CASE_STATUS_CHANGED",
-                payload={
-                    "from_status": case.status.value,
-                    "to_status": CaseStatus.WAIT_R1_CLEANUP_THUMBS.value,
-                },
-            )
+        await self._audit_repository.append_events(
+            [
+                AuditEventCreateInput(
+                    case_id=case_id,
+                    actor_type="bot",
+                    room_id=case.room1_origin_room_id,
+                    matrix_event_id=event_id,
+                    event_type="ROOM1_FINAL_REPLY_POSTED",
+                    payload={"job_type": job_type},
+                ),
+                AuditEventCreateInput(
+                    case_id=case_id,
+                    actor_type="system",
+                    event_type="CASE_STATUS_CHANGED",
+                    payload={
+                        "from_status": case.status.value,
+                        "to_status": CaseStatus.WAIT_R1_CLEANUP_THUMBS.value,
+                    },
+                ),
+            ]
         )
 
         logger.info(
@@ -192,81 +191,124 @@ class PostRoom1FinalService:
         return PostRoom1FinalResult(posted=True)
 
 
+@dataclass(frozen=True, slots=True)
+class _FinalPatientContext:
+    """Patient fields shared by every Room-1 final reply variant."""
+
+    name: str | None
+    age: str | None
+    requested_exam: str | None
+
+
+_FinalRenderer = Callable[
+    [CaseFinalReplySnapshot, dict[str, object], _FinalPatientContext],
+    str,
+]
+
+
 def _render_final_message(
     *,
     case: CaseFinalReplySnapshot,
     job_type: str,
     payload: dict[str, object],
 ) -> str:
-    patient_name, patient_age = extract_patient_name_age(case.structured_data_json)
-    requested_exam = extract_requested_exam(case.structured_data_json)
-
-    if job_type == "post_room1_final_denial_triage":
-        _require_status(case=case, expected=CaseStatus.DOCTOR_DENIED, job_type=job_type)
-        reason = case.doctor_reason or "not provided"
-        return build_room1_final_denied_triage_message(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-            patient_age=patient_age,
-            requested_exam=requested_exam,
-            reason=reason,
+    entry = _FINAL_RENDERERS.get(job_type)
+    if entry is None:
+        raise PostRoom1FinalRetriableError(
+            cause="room1_final",
+            details=f"Unsupported final reply job type: {job_type}",
         )
+    expected_status, render = entry
+    _require_status(case=case, expected=expected_status, job_type=job_type)
+    patient_name, patient_age = extract_patient_name_age(case.structured_data_json)
+    patient = _FinalPatientContext(
+        name=patient_name,
+        age=patient_age,
+        requested_exam=extract_requested_exam(case.structured_data_json),
+    )
+    return render(case, payload, patient)
 
-    if job_type == "post_room1_final_appt":
-        _require_status(case=case, expected=CaseStatus.APPT_CONFIRMED, job_type=job_type)
-        if (
-            case.appointment_at is None
-            or case.appointment_location is None
-            or case.appointment_instructions is None
-        ):
-            raise PostRoom1FinalRetriableError(
-                cause="room1_final",
-                details="Missing appointment fields for accepted final reply",
-            )
-        return build_room1_final_accepted_message(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-            patient_age=patient_age,
-            requested_exam=requested_exam,
-            appointment_at=case.appointment_at,
-            location=case.appointment_location,
-            instructions=case.appointment_instructions,
-        )
 
-    if job_type == "post_room1_final_appt_denied":
-        _require_status(case=case, expected=CaseStatus.APPT_DENIED, job_type=job_type)
-        reason = case.appointment_reason or "not provided"
-        return build_room1_final_denied_appointment_message(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-            patient_age=patient_age,
-            requested_exam=requested_exam,
-            reason=reason,
-        )
+def _render_denied_triage(
+    case: CaseFinalReplySnapshot,
+    payload: dict[str, object],
+    patient: _FinalPatientContext,
+) -> str:
+    return build_room1_final_denied_triage_message(
+        case_id=case.case_id,
+        agency_record_number=case.agency_record_number,
+        patient_name=patient.name,
+        patient_age=patient.age,
+        requested_exam=patient.requested_exam,
+        reason=case.doctor_reason or "not provided",
+    )
+
 
-    if job_type == "post_room1_final_failure":
-        _require_status(case=case, expected=CaseStatus.FAILED, job_type=job_type)
-        cause = _payload_string(payload=payload, key="cause", default="other")
-        details = _payload_string(payload=payload, key="details", default="not provided")
-        return build_room1_final_failure_message(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-            patient_age=patient_age,
-            requested_exam=requested_exam,
-            cause=cause,
-            details=details,
+def _render_accepted(
+    case: CaseFinalReplySnapshot,
+    payload: dict[str, object],
+    patient: _FinalPatientContext,
+) -> str:
+    if (
+        case.appointment_at is None
+        or case.appointment_location is None
+        or case.appointment_instructions is None
+    ):
+        raise PostRoom1FinalRetriableError(
+            cause="room1_final",
+            details="Missing appointment fields for accepted final reply",
         )
+    return build_room1_final_accepted_message(
+        case_id=case.case_id,
+        agency_record_number=case.agency_record_number,
+        patient_name=patient.name,
+        patient_age=patient.age,
+        requested_exam=patient.requested_exam,
+        appointment_at=case.appointment_at,
+        location=case.appointment_location,
+        instructions=case.appointment_instructions,
+    )
+
 
-    raise PostRoom1FinalRetriableError(
-        cause="room1_final",
-        details=f"Unsupported final reply job type: {job_type}",
+def _render_denied_appointment(
+    case: CaseFinalReplySnapshot,
+    payload: dict[str, object],
+    patient: _FinalPatientContext,
+) -> str:
+    return build_room1_final_denied_appointment_message(
+        case_id=case.case_id,
+        agency_record_number=case.agency_record_number,
+        patient_name=patient.name,
+        patient_age=patient.age,
+        requested_exam=patient.requested_exam,
+        reason=case.appointment_reason or "not provided",
     )
 
 
+def _render_failure(
+    case: CaseFinalReplySnapshot,
+    payload: dict[str, object],
+    patient: _FinalPatientContext,
+) -> str:
+    return build_room1_final_failure_message(
+        case_id=case.case_id,
+        agency_record_number=case.agency_record_number,
+        patient_name=patient.name,
+        patient_age=patient.age,
+        requested_exam=patient.requested_exam,
+        cause=_payload_string(payload=payload, key="cause", default="other"),
+        details=_payload_string(payload=payload, key="details", default="not provided"),
+    )
+
+
+_FINAL_RENDERERS: Final[dict[str, tuple[CaseStatus, _FinalRenderer]]] = {
+    "post_room1_final_denial_triage": (CaseStatus.DOCTOR_DENIED, _render_denied_triage),
+    "post_room1_final_appt": (CaseStatus.APPT_CONFIRMED, _render_accepted),
+    "post_room1_final_appt_denied": (CaseStatus.APPT_DENIED, _render_denied_appointment),
+    "post_room1_final_failure": (CaseStatus.FAILED, _render_failure),
+}
+
+
 def _require_status(
     *,
     case: CaseFinalReplySnapshot,
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Protocol
+from itertools import pairwise
+from typing import Any, Final, Protocol
 from uuid import UUID
 
 from triage_automation.application.ports.audit_repository_port import (
@@ -33,12 +36,19 @@ from triage_automation.infrastructure.matrix.message_templates import (
     build_room2_case_decision_template_formatted_html,
     build_room2_case_decision_template_message,
     build_room2_case_pdf_attachment_filename,
-    build_room2_case_summary_formatted_html,
-    build_room2_case_summary_message,
+    build_room2_case_summary_bodies,
 )
 
 logger = logging.getLogger(__name__)
 
+_ROOM2_POSTABLE_STATUSES: Final[frozenset[CaseStatus]] = frozenset(
+    {CaseStatus.LLM_SUGGEST, CaseStatus.R2_POST_WIDGET}
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(tz=UTC)
+
 
 class MatrixRoomPosterPort(Protocol):
     """Port used to post standard text messages into Matrix rooms."""
@@ -108,6 +118,7 @@ class PostRoom2WidgetService:
         message_repository: MessageRepositoryPort,
         prior_case_queries: PriorCaseQueryPort,
         matrix_poster: MatrixRoomPosterPort,
+        now: Callable[[], datetime] = _utc_now,
     ) -> None:
         self._room2_id = room2_id
         self._widget_public_base_url = widget_public_base_url.rstrip("/")
@@ -116,64 +127,33 @@ class PostRoom2WidgetService:
         self._message_repository = message_repository
         self._prior_case_queries = prior_case_queries
         self._matrix_poster = matrix_poster
+        self._now = now
 
     async def post_widget(self, *, case_id: UUID) -> dict[str, object]:
         """Post Room-2 root message plus doctor-facing review/reply context messages."""
 
         logger.info("room2_widget_post_started case_id=%s", case_id)
-        case = await self._case_repository.get_case_room2_widget_snapshot(case_id=case_id)
-        if case is None:
-            raise PostRoom2WidgetRetriableError(cause="room2", details="Case not found")
-
-        if case.status not in {CaseStatus.LLM_SUGGEST, CaseStatus.R2_POST_WIDGET}:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details=f"Case status {case.status.value} is not ready for Room-2 widget post",
-            )
-
-        if case.extracted_text is None or not case.extracted_text.strip():
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing extracted_text for Room-2 case context post",
-            )
-        if case.pdf_mxc_url is None:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing pdf_mxc_url for Room-2 case context attachment",
-            )
-        if case.agency_record_number is None:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing agency_record_number for Room-2 widget",
-            )
-        if case.structured_data_json is None:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing structured_data_json for Room-2 widget",
-            )
-        if case.summary_text is None:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing summary_text for Room-2 widget",
-            )
-        if case.suggested_action_json is None:
-            raise PostRoom2WidgetRetriableError(
-                cause="room2",
-                details="Missing suggested_action_json for Room-2 widget",
-            )
+        # The prior-case lookup resolves the record number from the case row itself, so
+        # it overlaps the snapshot read; both settle before either error is raised.
+        case_outcome, prior_outcome = await asyncio.gather(
+            self._case_repository.get_case_room2_widget_snapshot(case_id=case_id),
+            self._prior_case_queries.lookup_recent_context_by_case_id(
+                case_id=case_id,
+                now=self._now(),
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(case_outcome, BaseException):
+            raise case_outcome
+        case = _validate_room2_snapshot(case_outcome)
         structured_data_json = case.structured_data_json
         summary_text = case.summary_text
         suggested_action_json = case.suggested_action_json
-        assert structured_data_json is not None
-        assert summary_text is not None
-        assert suggested_action_json is not None
         patient_name, _ = extract_patient_name_age(structured_data_json)
 
-        prior_context = await self._prior_case_queries.lookup_recent_context(
-            case_id=case_id,
-            agency_record_number=case.agency_record_number,
-            now=datetime.now(tz=UTC),
-        )
+        if isinstance(prior_outcome, BaseException):
+            raise prior_outcome
+        prior_context = prior_outcome
         recent_denial_found = prior_context.prior_case is not None
         recent_denial_case_id = (
             str(prior_context.prior_case.prior_case_id)
@@ -190,7 +170,7 @@ class PostRoom2WidgetService:
             prior_context.prior_denial_count_7d,
         )
 
-        await self._audit_repository.append_event(
+        pending_events = [
             AuditEventCreateInput(
                 case_id=case_id,
                 actor_type="system",
@@ -205,68 +185,14 @@ class PostRoom2WidgetService:
                     "prior_case_id": recent_denial_case_id,
                 },
             )
-        )
+        ]
 
         root_filename = build_room2_case_pdf_attachment_filename(
             case_id=case.case_id,
             agency_record_number=case.agency_record_number,
         )
-        root_event_id = await self._matrix_poster.send_file_from_mxc(
-            room_id=self._room2_id,
-            filename=root_filename,
-            mxc_url=case.pdf_mxc_url,
-            mimetype="application/pdf",
-        )
-        logger.info(
-            "room2_widget_posted case_id=%s room_id=%s event_id=%s",
-            case.case_id,
-            self._room2_id,
-            root_event_id,
-        )
-
-        await self._message_repository.add_message(
-            CaseMessageCreateInput(
-                case_id=case.case_id,
-                room_id=self._room2_id,
-                event_id=root_event_id,
-                sender_user_id=None,
-                kind="room2_case_root",
-            )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
-            CaseMatrixMessageTranscriptCreateInput(
-                case_id=case.case_id,
-                room_id=self._room2_id,
-                event_id=root_event_id,
-                sender="bot",
-                message_type="room2_case_root",
-                message_text=(
-                    f"filename={root_filename} mxc_url={case.pdf_mxc_url} "
-                    "mimetype=application/pdf"
-                ),
-            )
-        )
-
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=case.case_id,
-                actor_type="bot",
-                room_id=self._room2_id,
-                matrix_event_id=root_event_id,
-                event_type="ROOM2_WIDGET_POSTED",
-                payload={
-                    "case_id": str(case.case_id),
-                    "record_number": case.agency_record_number,
-                    "patient_name": patient_name,
-                    "filename": root_filename,
-                    "pdf_mxc_url": case.pdf_mxc_url,
-                },
-            )
-        )
-
         recent_denial_context = _build_recent_denial_context(prior_context=prior_context)
-
-        summary_body = build_room2_case_summary_message(
+        summary_body, summary_formatted_body = build_room2_case_summary_bodies(
             case_id=case.case_id,
             agency_record_number=case.agency_record_number,
             patient_name=patient_name,
@@ -275,210 +201,309 @@ class PostRoom2WidgetService:
             suggested_action=suggested_action_json,
             recent_denial_context=recent_denial_context,
         )
-        summary_formatted_body = build_room2_case_summary_formatted_html(
+        instructions_body = build_room2_case_decision_instructions_message(
             case_id=case.case_id,
             agency_record_number=case.agency_record_number,
             patient_name=patient_name,
-            structured_data=structured_data_json,
-            summary_text=summary_text,
-            suggested_action=suggested_action_json,
-            recent_denial_context=recent_denial_context,
-        )
-        summary_event_id = await self._matrix_poster.reply_text(
-            room_id=self._room2_id,
-            event_id=root_event_id,
-            body=summary_body,
-            formatted_body=summary_formatted_body,
-        )
-        logger.info(
-            "room2_summary_posted case_id=%s room_id=%s event_id=%s parent_event_id=%s",
-            case.case_id,
-            self._room2_id,
-            summary_event_id,
-            root_event_id,
-        )
-
-        await self._message_repository.add_message(
-            CaseMessageCreateInput(
-                case_id=case.case_id,
-                room_id=self._room2_id,
-                event_id=summary_event_id,
-                sender_user_id=None,
-                kind="room2_case_summary",
-            )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
-            CaseMatrixMessageTranscriptCreateInput(
-                case_id=case.case_id,
-                room_id=self._room2_id,
-                event_id=summary_event_id,
-                sender="bot",
-                message_type="room2_case_summary",
-                message_text=summary_body,
-                reply_to_event_id=root_event_id,
-            )
-        )
-
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=case.case_id,
-                actor_type="bot",
-                room_id=self._room2_id,
-                matrix_event_id=summary_event_id,
-                event_type="ROOM2_CASE_SUMMARY_POSTED",
-                payload={"reply_to_event_id": root_event_id},
-            )
         )
-
-        instructions_body = build_room2_case_decision_instructions_message(
+        instructions_formatted_body = build_room2_case_decision_instructions_formatted_html(
             case_id=case.case_id,
             agency_record_number=case.agency_record_number,
             patient_name=patient_name,
         )
-        instructions_formatted_body = build_room2_case_decision_instructions_formatted_html(
+        template_body = build_room2_case_decision_template_message(
             case_id=case.case_id,
             agency_record_number=case.agency_record_number,
             patient_name=patient_name,
         )
-        instructions_event_id = await self._matrix_poster.reply_text(
-            room_id=self._room2_id,
-            event_id=root_event_id,
-            body=instructions_body,
-            formatted_body=instructions_formatted_body,
-        )
-        logger.info(
-            (
-                "room2_instructions_posted case_id=%s room_id=%s event_id=%s "
-                "parent_event_id=%s"
-            ),
-            case.case_id,
-            self._room2_id,
-            instructions_event_id,
-            root_event_id,
+        template_formatted_body = build_room2_case_decision_template_formatted_html(
+            case_id=case.case_id,
+            agency_record_number=case.agency_record_number,
+            patient_name=patient_name,
         )
 
-        await self._message_repository.add_message(
-            CaseMessageCreateInput(
-                case_id=case.case_id,
+        # Audit rows are buffered and written in one batch, including when a post fails
+        # part way, so the trail still covers every message that reached the room.
+        try:
+            # Matrix posts stay sequential so doctors see the replies in a fixed order; the
+            # bookkeeping rows of each post are written while the next post is in flight.
+            root_event_id = await self._matrix_poster.send_file_from_mxc(
                 room_id=self._room2_id,
-                event_id=instructions_event_id,
-                sender_user_id=None,
-                kind="room2_case_instructions",
+                filename=root_filename,
+                mxc_url=case.pdf_mxc_url,
+                mimetype="application/pdf",
             )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
-            CaseMatrixMessageTranscriptCreateInput(
+            logger.info(
+                "room2_widget_posted case_id=%s room_id=%s event_id=%s",
+                case.case_id,
+                self._room2_id,
+                root_event_id,
+            )
+
+            summary_event_id = await _post_while_recording(
+                self._matrix_poster.reply_text(
+                    room_id=self._room2_id,
+                    event_id=root_event_id,
+                    body=summary_body,
+                    formatted_body=summary_formatted_body,
+                ),
+                self._record_post(
+                    case_id=case.case_id,
+                    event_id=root_event_id,
+                    kind="room2_case_root",
+                    message_text=(
+                        f"filename={root_filename} mxc_url={case.pdf_mxc_url} "
+                        "mimetype=application/pdf"
+                    ),
+                    reply_to_event_id=None,
+                    audit_event_type="ROOM2_WIDGET_POSTED",
+                    audit_payload={
+                        "case_id": str(case.case_id),
+                        "record_number": case.agency_record_number,
+                        "patient_name": patient_name,
+                        "filename": root_filename,
+                        "pdf_mxc_url": case.pdf_mxc_url,
+                    },
+                    pending_events=pending_events,
+                ),
+            )
+            logger.info(
+                "room2_summary_posted case_id=%s room_id=%s event_id=%s parent_event_id=%s",
+                case.case_id,
+                self._room2_id,
+                summary_event_id,
+                root_event_id,
+            )
+
+            instructions_event_id = await _post_while_recording(
+                self._matrix_poster.reply_text(
+                    room_id=self._room2_id,
+                    event_id=root_event_id,
+                    body=instructions_body,
+                    formatted_body=instructions_formatted_body,
+                ),
+                self._record_post(
+                    case_id=case.case_id,
+                    event_id=summary_event_id,
+                    kind="room2_case_summary",
+                    message_text=summary_body,
+                    reply_to_event_id=root_event_id,
+                    audit_event_type="ROOM2_CASE_SUMMARY_POSTED",
+                    audit_payload={"reply_to_event_id": root_event_id},
+                    pending_events=pending_events,
+                ),
+            )
+            logger.info(
+                (
+                    "room2_instructions_posted case_id=%s room_id=%s event_id=%s "
+                    "parent_event_id=%s"
+                ),
+                case.case_id,
+                self._room2_id,
+                instructions_event_id,
+                root_event_id,
+            )
+
+            template_event_id = await _post_while_recording(
+                self._matrix_poster.reply_text(
+                    room_id=self._room2_id,
+                    event_id=root_event_id,
+                    body=template_body,
+                    formatted_body=template_formatted_body,
+                ),
+                self._record_post(
+                    case_id=case.case_id,
+                    event_id=instructions_event_id,
+                    kind="room2_case_instructions",
+                    message_text=instructions_body,
+                    reply_to_event_id=root_event_id,
+                    audit_event_type="ROOM2_CASE_INSTRUCTIONS_POSTED",
+                    audit_payload={"reply_to_event_id": root_event_id},
+                    pending_events=pending_events,
+                ),
+            )
+            logger.info(
+                (
+                    "room2_template_posted case_id=%s room_id=%s event_id=%s "
+                    "parent_event_id=%s"
+                ),
+                case.case_id,
+                self._room2_id,
+                template_event_id,
+                root_event_id,
+            )
+
+            await self._record_post(
                 case_id=case.case_id,
-                room_id=self._room2_id,
-                event_id=instructions_event_id,
-                sender="bot",
-                message_type="room2_case_instructions",
-                message_text=instructions_body,
+                event_id=template_event_id,
+                kind="room2_case_template",
+                message_text=template_body,
                 reply_to_event_id=root_event_id,
+                audit_event_type="ROOM2_CASE_TEMPLATE_POSTED",
+                audit_payload={"reply_to_event_id": root_event_id},
+                pending_events=pending_events,
             )
-        )
 
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
+            # Guarded on the postable statuses so a concurrent status change is never
+            # overwritten; the audit records the status the row actually left.
+            status_before_wait = await self._case_repository.transition_status(
                 case_id=case.case_id,
-                actor_type="bot",
-                room_id=self._room2_id,
-                matrix_event_id=instructions_event_id,
-                event_type="ROOM2_CASE_INSTRUCTIONS_POSTED",
-                payload={"reply_to_event_id": root_event_id},
+                from_statuses=_ROOM2_POSTABLE_STATUSES,
+                to_status=CaseStatus.WAIT_DOCTOR,
             )
-        )
+            if status_before_wait is None:
+                raise PostRoom2WidgetRetriableError(
+                    cause="room2",
+                    details="Case status changed before Room-2 WAIT_DOCTOR transition",
+                )
+
+            # An LLM_SUGGEST case crosses R2_POST_WIDGET within the same write, so both
+            # state-machine edges are audited, starting from the status it actually left.
+            transition_path = (
+                (status_before_wait, CaseStatus.R2_POST_WIDGET, CaseStatus.WAIT_DOCTOR)
+                if status_before_wait is CaseStatus.LLM_SUGGEST
+                else (status_before_wait, CaseStatus.WAIT_DOCTOR)
+            )
+            pending_events.extend(
+                AuditEventCreateInput(
+                    case_id=case.case_id,
+                    actor_type="system",
+                    event_type="CASE_STATUS_CHANGED",
+                    payload={"from_status": from_status.value, "to_status": to_status.value},
+                )
+                for from_status, to_status in pairwise(transition_path)
+            )
+        finally:
+            await self._audit_repository.append_events(pending_events)
 
-        template_body = build_room2_case_decision_template_message(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-        )
-        template_formatted_body = build_room2_case_decision_template_formatted_html(
-            case_id=case.case_id,
-            agency_record_number=case.agency_record_number,
-            patient_name=patient_name,
-        )
-        template_event_id = await self._matrix_poster.reply_text(
-            room_id=self._room2_id,
-            event_id=root_event_id,
-            body=template_body,
-            formatted_body=template_formatted_body,
-        )
         logger.info(
-            (
-                "room2_template_posted case_id=%s room_id=%s event_id=%s "
-                "parent_event_id=%s"
-            ),
+            "room2_widget_post_completed case_id=%s to_status=%s",
             case.case_id,
-            self._room2_id,
-            template_event_id,
-            root_event_id,
+            CaseStatus.WAIT_DOCTOR.value,
         )
+        return {}
 
-        await self._message_repository.add_message(
+    async def _record_post(
+        self,
+        *,
+        case_id: UUID,
+        event_id: str,
+        kind: str,
+        message_text: str,
+        reply_to_event_id: str | None,
+        audit_event_type: str,
+        audit_payload: dict[str, object],
+        pending_events: list[AuditEventCreateInput],
+    ) -> None:
+        """Persist message mapping and transcript for one Room-2 post and buffer its audit."""
+
+        await self._message_repository.add_message_with_transcript(
             CaseMessageCreateInput(
-                case_id=case.case_id,
+                case_id=case_id,
                 room_id=self._room2_id,
-                event_id=template_event_id,
+                event_id=event_id,
                 sender_user_id=None,
-                kind="room2_case_template",
-            )
-        )
-        await self._message_repository.append_case_matrix_message_transcript(
+                kind=kind,
+            ),
             CaseMatrixMessageTranscriptCreateInput(
-                case_id=case.case_id,
+                case_id=case_id,
                 room_id=self._room2_id,
-                event_id=template_event_id,
+                event_id=event_id,
                 sender="bot",
-                message_type="room2_case_template",
-                message_text=template_body,
-                reply_to_event_id=root_event_id,
-            )
+                message_type=kind,
+                message_text=message_text,
+                reply_to_event_id=reply_to_event_id,
+            ),
         )
-
-        await self._audit_repository.append_event(
+        pending_events.append(
             AuditEventCreateInput(
-                case_id=case.case_id,
+                case_id=case_id,
                 actor_type="bot",
                 room_id=self._room2_id,
-                matrix_event_id=template_event_id,
-                event_type="ROOM2_CASE_TEMPLATE_POSTED",
-                payload={"reply_to_event_id": root_event_id},
+                matrix_event_id=event_id,
+                event_type=audit_event_type,
+                payload=audit_payload,
             )
         )
 
-        status_before_wait = case.status
-        if case.status == CaseStatus.LLM_SUGGEST:
-            await self._case_repository.update_status(
-                case_id=case.case_id,
-                status=CaseStatus.R2_POST_WIDGET,
-            )
-            status_before_wait = CaseStatus.R2_POST_WIDGET
 
-        await self._case_repository.update_status(
-            case_id=case.case_id,
-            status=CaseStatus.WAIT_DOCTOR,
-        )
+async def _post_while_recording(post: Awaitable[str], record: Awaitable[None]) -> str:
+    """Await the next Matrix post alongside the previous post's bookkeeping.
 
-        await self._audit_repository.append_event(
-            AuditEventCreateInput(
-                case_id=case.case_id,
-                actor_type="system",
-                event_type="CASE_STATUS_CHANGED",
-                payload={
-                    "from_status": status_before_wait.value,
-                    "to_status": CaseStatus.WAIT_DOCTOR.value,
-                },
-            )
+    Both operations always settle before a failure is re-raised, so a failed post
+    never leaves the previous post's rows half written.
+    """
+
+    event_id, recorded = await asyncio.gather(post, record, return_exceptions=True)
+    if isinstance(recorded, BaseException):
+        raise recorded
+    if isinstance(event_id, BaseException):
+        raise event_id
+    return event_id
+
+
+@dataclass(frozen=True, slots=True)
+class _ValidatedRoom2Snapshot:
+    """Room-2 snapshot whose fields required for posting are known to be present."""
+
+    case_id: UUID
+    pdf_mxc_url: str
+    agency_record_number: str
+    structured_data_json: dict[str, Any]
+    summary_text: str
+    suggested_action_json: dict[str, Any]
+
+
+def _validate_room2_snapshot(case: CaseRoom2WidgetSnapshot | None) -> _ValidatedRoom2Snapshot:
+    """Check status and required fields once, returning a non-optional view for posting."""
+
+    if case is None:
+        raise PostRoom2WidgetRetriableError(cause="room2", details="Case not found")
+
+    if case.status not in _ROOM2_POSTABLE_STATUSES:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details=f"Case status {case.status.value} is not ready for Room-2 widget post",
         )
 
-        logger.info(
-            "room2_widget_post_completed case_id=%s to_status=%s",
-            case.case_id,
-            CaseStatus.WAIT_DOCTOR.value,
+    if case.extracted_text is None or not case.extracted_text.strip():
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing extracted_text for Room-2 case context post",
         )
-        return {}
+    if case.pdf_mxc_url is None:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing pdf_mxc_url for Room-2 case context attachment",
+        )
+    if case.agency_record_number is None:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing agency_record_number for Room-2 widget",
+        )
+    if case.structured_data_json is None:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing structured_data_json for Room-2 widget",
+        )
+    if case.summary_text is None:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing summary_text for Room-2 widget",
+        )
+    if case.suggested_action_json is None:
+        raise PostRoom2WidgetRetriableError(
+            cause="room2",
+            details="Missing suggested_action_json for Room-2 widget",
+        )
+    return _ValidatedRoom2Snapshot(
+        case_id=case.case_id,
+        pdf_mxc_url=case.pdf_mxc_url,
+        agency_record_number=case.agency_record_number,
+        structured_data_json=case.structured_data_json,
+        summary_text=case.summary_text,
+        suggested_action_json=case.suggested_action_json,
+    )
 
 
 def _build_widget_payload(
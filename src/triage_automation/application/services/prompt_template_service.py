@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from triage_automation.application.ports.prompt_template_repository_port import (
@@ -32,10 +35,25 @@ class MissingActivePromptTemplateError(LookupError):
 
 
 class PromptTemplateService:
-    """Load active prompt content/version for worker orchestration use."""
+    """Load active prompt content/version for worker orchestration use.
 
-    def __init__(self, *, prompt_templates: PromptTemplateRepositoryPort) -> None:
+    With `pair_cache_ttl_seconds` above zero, prompt pairs are cached per process.
+    Activations are made by the bot API process, so a worker keeps using the previously
+    active pair for up to that TTL, and each worker process switches independently.
+    """
+
+    def __init__(
+        self,
+        *,
+        prompt_templates: PromptTemplateRepositoryPort,
+        pair_cache_ttl_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._prompt_templates = prompt_templates
+        self._pair_cache_ttl_seconds = pair_cache_ttl_seconds
+        self._clock = clock
+        self._pair_cache: dict[tuple[str, str], tuple[float, ActivePromptTemplatePair]] = {}
+        self._pair_cache_lock = asyncio.Lock()
 
     async def get_required_active_prompt(self, *, name: str) -> PromptTemplateRecord:
         """Return active prompt template or raise explicit missing-template error."""
@@ -51,7 +69,37 @@ class PromptTemplateService:
         system_prompt_name: str,
         user_prompt_name: str,
     ) -> ActivePromptTemplatePair:
-        """Return required active system/user prompt pair by configured names."""
+        """Return required active system/user prompt pair, cached for the configured TTL."""
+
+        if self._pair_cache_ttl_seconds <= 0:
+            return await self._load_active_prompt_pair(
+                system_prompt_name=system_prompt_name,
+                user_prompt_name=user_prompt_name,
+            )
+
+        key = (system_prompt_name, user_prompt_name)
+        cached = self._pair_cache.get(key)
+        if cached is not None and self._clock() < cached[0]:
+            return cached[1]
+
+        async with self._pair_cache_lock:
+            cached = self._pair_cache.get(key)
+            if cached is not None and self._clock() < cached[0]:
+                return cached[1]
+            pair = await self._load_active_prompt_pair(
+                system_prompt_name=system_prompt_name,
+                user_prompt_name=user_prompt_name,
+            )
+            self._pair_cache[key] = (self._clock() + self._pair_cache_ttl_seconds, pair)
+            return pair
+
+    async def _load_active_prompt_pair(
+        self,
+        *,
+        system_prompt_name: str,
+        user_prompt_name: str,
+    ) -> ActivePromptTemplatePair:
+        """Load the active system/user prompt pair from the repository."""
 
         system_prompt = await self.get_required_active_prompt(name=system_prompt_name)
         user_prompt = await self.get_required_active_prompt(name=user_prompt_name)
@@ -6,7 +6,7 @@ import re
 from collections.abc import Iterable
 
 _FORBIDDEN_ENGLISH_TERMS_PATTERN = re.compile(
-    r"\b("
+    r"\b(?:"
     r"accept|accepted|deny|denied|support|reason|because|therefore|however|"
     r"patient|summary|recommendation|recommended|required|insufficient|"
     r"unknown|none|dinai|die"
@@ -24,3 +24,8 @@ def collect_forbidden_terms(*, texts: Iterable[str]) -> list[str]:
             found.add(match.group(0).lower())
     return sorted(found)
 
+
+def has_forbidden_terms(*, texts: Iterable[str]) -> bool:
+    """Return whether any narrative text contains a forbidden English token."""
+
+    return any(_FORBIDDEN_ENGLISH_TERMS_PATTERN.search(text) for text in texts)
@@ -6,7 +6,8 @@ from __future__ import annotations
 def normalize_user_email(*, email: str) -> str:
     """Normalize one user email and reject blank values."""
 
-    normalized = email.strip().lower()
+    stripped = email.strip()
+    normalized = stripped if stripped.islower() else stripped.lower()
     if not normalized:
         raise ValueError("email cannot be blank")
     return normalized
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -37,3 +39,26 @@ class SqlAlchemyAuditRepository(AuditRepositoryPort):
 
         inserted_id = result.scalar_one()
         return int(inserted_id)
+
+    async def append_events(self, payloads: Sequence[AuditEventCreateInput]) -> None:
+        """Insert several audit event rows with one executemany statement."""
+
+        if not payloads:
+            return
+
+        rows = [
+            {
+                "case_id": payload.case_id,
+                "actor_type": payload.actor_type,
+                "actor_user_id": payload.actor_user_id,
+                "room_id": payload.room_id,
+                "matrix_event_id": payload.matrix_event_id,
+                "event_type": payload.event_type,
+                "payload": payload.payload,
+            }
+            for payload in payloads
+        ]
+
+        async with self._session_factory() as session:
+            await session.execute(sa.insert(case_events), rows)
+            await session.commit()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
@@ -26,6 +27,7 @@ from triage_automation.application.ports.case_repository_port import (
     CaseRecoverySnapshot,
     CaseRepositoryPort,
     CaseRoom2WidgetSnapshot,
+    DoctorDecisionApplyResult,
     DoctorDecisionUpdateInput,
     DuplicateCaseOriginEventError,
     Room1FinalReplyReactionSnapshot,
@@ -104,16 +106,29 @@ def _to_case_record(row: RowMapping) -> CaseRecord:
     )
 
 
-def _extract_patient_name_from_structured_data(
-    structured_data_json: dict[str, Any] | None,
-) -> str | None:
-    """Extract normalized patient name from structured case payload."""
+def _patient_projection_columns() -> tuple[sa.ColumnElement[Any], sa.ColumnElement[Any]]:
+    """Project only patient sub-objects so full structured payloads stay in the database."""
+
+    return (
+        cases.c.structured_data_json["patient"].label("structured_patient"),
+        cases.c.structured_data_json["paciente"].label("structured_paciente"),
+    )
+
+
+def _extract_patient_name_from_projection(row: RowMapping) -> str | None:
+    """Extract normalized patient name from projected patient sub-objects."""
+
+    return _extract_patient_name_from_patient_nodes(
+        row["structured_patient"],
+        row["structured_paciente"],
+    )
+
+
+def _extract_patient_name_from_patient_nodes(patient_raw: Any, paciente_raw: Any) -> str | None:
+    """Extract normalized patient name from English/Portuguese patient nodes."""
 
-    if not isinstance(structured_data_json, dict):
-        return None
-    patient_raw = structured_data_json.get("patient")
     if not isinstance(patient_raw, dict):
-        patient_raw = structured_data_json.get("paciente")
+        patient_raw = paciente_raw
     if not isinstance(patient_raw, dict):
         return None
     candidate = patient_raw.get("name")
@@ -265,11 +280,11 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
             structured_data_json=cast(dict[str, Any] | None, row["structured_data_json"]),
         )
 
-    async def apply_doctor_decision_if_waiting(
+    async def apply_doctor_decision(
         self,
         payload: DoctorDecisionUpdateInput,
-    ) -> bool:
-        """Apply doctor decision only when case is still waiting for doctor input."""
+    ) -> DoctorDecisionApplyResult:
+        """Apply doctor decision when waiting, returning ack context in the same round trip."""
 
         target_status = (
             CaseStatus.DOCTOR_DENIED
@@ -292,19 +307,32 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                 status=target_status.value,
                 updated_at=sa.func.current_timestamp(),
             )
+            .returning(cases.c.agency_record_number, cases.c.structured_data_json)
         )
 
+        current_status: CaseStatus | None = None
+        already_decided = False
         async with self._session_factory() as session:
-            result = cast(CursorResult[Any], await session.execute(statement))
+            applied_row = (await session.execute(statement)).mappings().first()
+            if applied_row is None:
+                current_row = (
+                    await session.execute(
+                        sa.select(cases.c.status, cases.c.doctor_decided_at).where(
+                            cases.c.case_id == payload.case_id
+                        )
+                    )
+                ).mappings().first()
+                if current_row is not None:
+                    current_status = CaseStatus(cast(str, current_row["status"]))
+                    already_decided = current_row["doctor_decided_at"] is not None
             await session.commit()
 
-        applied = int(result.rowcount or 0) == 1
         logger.info(
             (
                 "case_doctor_decision_applied=%s case_id=%s from_status=%s to_status=%s "
                 "decision=%s support_flag=%s doctor_user_id=%s"
             ),
-            applied,
+            applied_row is not None,
             payload.case_id,
             CaseStatus.WAIT_DOCTOR.value,
             target_status.value,
@@ -312,7 +340,22 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
             payload.support_flag,
             payload.doctor_user_id,
         )
-        return applied
+        if applied_row is not None:
+            return DoctorDecisionApplyResult(
+                outcome="applied",
+                current_status=target_status,
+                agency_record_number=cast(str | None, applied_row["agency_record_number"]),
+                structured_data_json=cast(
+                    dict[str, Any] | None,
+                    applied_row["structured_data_json"],
+                ),
+            )
+        if current_status is None:
+            return DoctorDecisionApplyResult(outcome="not_found")
+        # A recorded decision means this submission repeats or lost the race to another one.
+        if already_decided or current_status is CaseStatus.WAIT_DOCTOR:
+            return DoctorDecisionApplyResult(outcome="duplicate", current_status=current_status)
+        return DoctorDecisionApplyResult(outcome="wrong_state", current_status=current_status)
 
     async def apply_scheduler_decision_if_waiting(
         self,
@@ -624,7 +667,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                 cases.c.status,
                 latest_activity.c.latest_activity_at,
                 cases.c.agency_record_number,
-                cases.c.structured_data_json,
+                *_patient_projection_columns(),
             )
             .select_from(from_clause)
             .order_by(
@@ -644,13 +687,12 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
         total = int(total_result.scalar_one())
         items: list[CaseMonitoringListItem] = []
         for row in result.mappings().all():
-            structured_data_json = cast(dict[str, Any] | None, row["structured_data_json"])
             items.append(
                 CaseMonitoringListItem(
                     case_id=cast("Any", row["case_id"]),
                     status=CaseStatus(cast(str, row["status"])),
                     latest_activity_at=cast(datetime, row["latest_activity_at"]),
-                    patient_name=_extract_patient_name_from_structured_data(structured_data_json),
+                    patient_name=_extract_patient_name_from_projection(row),
                     agency_record_number=cast(str | None, row["agency_record_number"]),
                 )
             )
@@ -671,7 +713,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
         case_statement = sa.select(
             cases.c.case_id,
             cases.c.status,
-            cases.c.structured_data_json,
+            *_patient_projection_columns(),
             cases.c.agency_record_number,
         ).where(cases.c.case_id == case_id)
         report_statement = (
@@ -785,7 +827,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                         timestamp=cast(datetime, row["captured_at"]),
                         room_id=None,
                         actor="llm",
-                        event_type=cast(str, row["stage"]),
+                        event_type=sys.intern(cast(str, row["stage"])),
                         content_text=None,
                         payload={
                             "input_payload": cast(dict[str, Any], row["input_payload"]),
@@ -802,6 +844,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                 )
             )
         for row in matrix_rows:
+            matrix_room_id = sys.intern(cast(str, row["room_id"]))
             sortable_events.append(
                 (
                     cast(datetime, row["captured_at"]),
@@ -809,12 +852,12 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                     int(row["id"]),
                     CaseMonitoringTimelineItem(
                         source="matrix",
-                        channel=cast(str, row["room_id"]),
+                        channel=matrix_room_id,
                         timestamp=cast(datetime, row["captured_at"]),
-                        room_id=cast(str, row["room_id"]),
+                        room_id=matrix_room_id,
                         actor=cast(str | None, row["sender_display_name"])
                         or cast(str, row["sender"]),
-                        event_type=cast(str, row["message_type"]),
+                        event_type=sys.intern(cast(str, row["message_type"])),
                         content_text=cast(str, row["message_text"]),
                         payload={
                             "event_id": cast(str, row["event_id"]),
@@ -824,11 +867,11 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                 )
             )
         for row in reaction_checkpoint_rows:
-            stage = cast(str, row["stage"])
-            room_id = cast(str, row["room_id"])
+            stage = sys.intern(cast(str, row["stage"]))
+            room_id = sys.intern(cast(str, row["room_id"]))
             target_event_id = cast(str, row["target_event_id"])
             expected_at = cast(datetime, row["expected_at"])
-            outcome = cast(str, row["outcome"])
+            outcome = sys.intern(cast(str, row["outcome"]))
             sortable_events.append(
                 (
                     expected_at,
@@ -840,7 +883,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                         timestamp=expected_at,
                         room_id=room_id,
                         actor="system",
-                        event_type=f"{stage}_POSITIVE_EXPECTED",
+                        event_type=sys.intern(f"{stage}_POSITIVE_EXPECTED"),
                         content_text=None,
                         payload={
                             "stage": stage,
@@ -868,7 +911,7 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
                         actor=cast(str | None, row["reactor_display_name"])
                         or cast(str | None, row["reactor_user_id"])
                         or "human",
-                        event_type=f"{stage}_POSITIVE_RECEIVED",
+                        event_type=sys.intern(f"{stage}_POSITIVE_RECEIVED"),
                         content_text=None,
                         payload={
                             "stage": stage,
@@ -883,12 +926,11 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
 
         sortable_events.sort(key=lambda item: (item[0], item[1], item[2]))
         timeline = [item[3] for item in sortable_events]
-        structured_data_json = cast(dict[str, Any] | None, case_row["structured_data_json"])
         return CaseMonitoringDetail(
             case_id=cast("Any", case_row["case_id"]),
             status=CaseStatus(cast(str, case_row["status"])),
             timeline=timeline,
-            patient_name=_extract_patient_name_from_structured_data(structured_data_json),
+            patient_name=_extract_patient_name_from_projection(case_row),
             agency_record_number=cast(str | None, case_row["agency_record_number"]),
         )
 
@@ -911,6 +953,52 @@ class SqlAlchemyCaseRepository(CaseRepositoryPort):
             int(result.rowcount or 0),
         )
 
+    async def transition_status(
+        self,
+        *,
+        case_id: UUID,
+        from_statuses: frozenset[CaseStatus],
+        to_status: CaseStatus,
+    ) -> CaseStatus | None:
+        """Move case to `to_status` only from `from_statuses`, returning the prior status.
+
+        Runs two statements in one transaction: a SELECT of the current status, then an
+        UPDATE guarded on that same status, so a concurrent change makes it a no-op.
+        """
+
+        prior_status: CaseStatus | None = None
+        async with self._session_factory() as session:
+            status_value = (
+                await session.execute(
+                    sa.select(cases.c.status).where(cases.c.case_id == case_id)
+                )
+            ).scalar_one_or_none()
+            if status_value is not None and CaseStatus(cast(str, status_value)) in from_statuses:
+                candidate_status = CaseStatus(cast(str, status_value))
+                result = cast(
+                    CursorResult[Any],
+                    await session.execute(
+                        sa.update(cases)
+                        .where(
+                            cases.c.case_id == case_id,
+                            cases.c.status == candidate_status.value,
+                        )
+                        .values(status=to_status.value, updated_at=sa.func.current_timestamp())
+                    ),
+                )
+                if int(result.rowcount or 0) == 1:
+                    prior_status = candidate_status
+            await session.commit()
+
+        logger.info(
+            "case_status_transitioned case_id=%s from_status=%s to_status=%s applied=%s",
+            case_id,
+            status_value,
+            to_status.value,
+            prior_status is not None,
+        )
+        return prior_status
+
     async def store_pdf_extraction(
         self,
         *,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -18,6 +19,8 @@ from triage_automation.application.ports.message_repository_port import (
 )
 from triage_automation.infrastructure.db.metadata import case_messages
 
+_MESSAGE_REF_PAGE_SIZE = 1000
+
 case_matrix_message_transcripts = sa.table(
     "case_matrix_message_transcripts",
     sa.column("id", sa.BigInteger()),
@@ -37,6 +40,29 @@ def _is_duplicate_room_event_error(error: IntegrityError) -> bool:
     return "case_messages.room_id, case_messages.event_id" in message
 
 
+def _message_insert(payload: CaseMessageCreateInput) -> sa.Insert:
+    return sa.insert(case_messages).values(
+        case_id=payload.case_id,
+        room_id=payload.room_id,
+        event_id=payload.event_id,
+        sender_user_id=payload.sender_user_id,
+        kind=payload.kind,
+    ).returning(case_messages.c.id)
+
+
+def _transcript_insert(payload: CaseMatrixMessageTranscriptCreateInput) -> sa.Insert:
+    return sa.insert(case_matrix_message_transcripts).values(
+        case_id=payload.case_id,
+        room_id=payload.room_id,
+        event_id=payload.event_id,
+        sender=payload.sender,
+        sender_display_name=payload.sender_display_name,
+        message_type=payload.message_type,
+        message_text=payload.message_text,
+        reply_to_event_id=payload.reply_to_event_id,
+    ).returning(case_matrix_message_transcripts.c.id)
+
+
 class SqlAlchemyMessageRepository(MessageRepositoryPort):
     """Message repository backed by SQLAlchemy async sessions."""
 
@@ -46,17 +72,9 @@ class SqlAlchemyMessageRepository(MessageRepositoryPort):
     async def add_message(self, payload: CaseMessageCreateInput) -> int:
         """Insert case message mapping and return inserted numeric id."""
 
-        statement = sa.insert(case_messages).values(
-            case_id=payload.case_id,
-            room_id=payload.room_id,
-            event_id=payload.event_id,
-            sender_user_id=payload.sender_user_id,
-            kind=payload.kind,
-        ).returning(case_messages.c.id)
-
         async with self._session_factory() as session:
             try:
-                result = await session.execute(statement)
+                result = await session.execute(_message_insert(payload))
                 await session.commit()
             except IntegrityError as error:
                 await session.rollback()
@@ -73,24 +91,34 @@ class SqlAlchemyMessageRepository(MessageRepositoryPort):
     ) -> int:
         """Insert full Matrix message transcript row and return inserted id."""
 
-        statement = sa.insert(case_matrix_message_transcripts).values(
-            case_id=payload.case_id,
-            room_id=payload.room_id,
-            event_id=payload.event_id,
-            sender=payload.sender,
-            sender_display_name=payload.sender_display_name,
-            message_type=payload.message_type,
-            message_text=payload.message_text,
-            reply_to_event_id=payload.reply_to_event_id,
-        ).returning(case_matrix_message_transcripts.c.id)
-
         async with self._session_factory() as session:
-            result = await session.execute(statement)
+            result = await session.execute(_transcript_insert(payload))
             await session.commit()
 
         inserted_id = result.scalar_one()
         return int(inserted_id)
 
+    async def add_message_with_transcript(
+        self,
+        message: CaseMessageCreateInput,
+        transcript: CaseMatrixMessageTranscriptCreateInput,
+    ) -> int:
+        """Insert message mapping and transcript in one transaction and return mapping id."""
+
+        async with self._session_factory() as session:
+            try:
+                result = await session.execute(_message_insert(message))
+                await session.execute(_transcript_insert(transcript))
+                await session.commit()
+            except IntegrityError as error:
+                await session.rollback()
+                if _is_duplicate_room_event_error(error):
+                    raise DuplicateCaseMessageError("Duplicate case message room/event") from error
+                raise
+
+        inserted_id = result.scalar_one()
+        return int(inserted_id)
+
     async def has_message_kind(self, *, case_id: UUID, room_id: str, kind: str) -> bool:
         """Return whether case already has message of `kind` in the given room."""
 
@@ -160,23 +188,36 @@ class SqlAlchemyMessageRepository(MessageRepositoryPort):
             kind=str(row["kind"]),
         )
 
-    async def list_message_refs_for_case(self, *, case_id: UUID) -> list[CaseMessageRef]:
-        """List all room/event references stored for a case."""
+    async def iter_message_refs_for_case(
+        self,
+        *,
+        case_id: UUID,
+    ) -> AsyncIterator[CaseMessageRef]:
+        """Yield room/event references for a case in id-keyed pages."""
+
+        last_id = 0
+        while True:
+            statement = (
+                sa.select(
+                    case_messages.c.id,
+                    case_messages.c.room_id,
+                    case_messages.c.event_id,
+                )
+                .where(
+                    case_messages.c.case_id == case_id,
+                    case_messages.c.id > last_id,
+                )
+                .order_by(case_messages.c.id)
+                .limit(_MESSAGE_REF_PAGE_SIZE)
+            )
 
-        statement = sa.select(
-            case_messages.c.room_id,
-            case_messages.c.event_id,
-        ).where(case_messages.c.case_id == case_id)
+            async with self._session_factory() as session:
+                result = await session.execute(statement)
+                rows = result.all()
 
-        async with self._session_factory() as session:
-            result = await session.execute(statement)
+            for row in rows:
+                yield CaseMessageRef(room_id=str(row.room_id), event_id=str(row.event_id))
 
-        refs: list[CaseMessageRef] = []
-        for row in result.mappings().all():
-            refs.append(
-                CaseMessageRef(
-                    room_id=str(row["room_id"]),
-                    event_id=str(row["event_id"]),
-                )
-            )
-        return refs
+            if len(rows) < _MESSAGE_REF_PAGE_SIZE:
+                return
+            last_id = int(rows[-1].id)
@@ -49,6 +49,44 @@ class SqlAlchemyPriorCaseQueries(PriorCaseQueryPort):
     ) -> PriorCaseContext:
         """Return seven-day prior-case context for Room-2 widget enrichment."""
 
+        return await self._lookup(
+            case_id=case_id,
+            record_number_filter=cases.c.agency_record_number == agency_record_number,
+            now=now,
+        )
+
+    async def lookup_recent_context_by_case_id(
+        self,
+        *,
+        case_id: UUID,
+        now: datetime | None = None,
+    ) -> PriorCaseContext:
+        """Return seven-day prior-case context keyed by the current case's record number.
+
+        The record number is resolved inside the same statement, so callers can run this
+        lookup without first loading the current case row.
+        """
+
+        current_record_number = (
+            sa.select(cases.c.agency_record_number)
+            .where(cases.c.case_id == case_id)
+            .scalar_subquery()
+        )
+        return await self._lookup(
+            case_id=case_id,
+            record_number_filter=cases.c.agency_record_number == current_record_number,
+            now=now,
+        )
+
+    async def _lookup(
+        self,
+        *,
+        case_id: UUID,
+        record_number_filter: sa.ColumnElement[bool],
+        now: datetime | None,
+    ) -> PriorCaseContext:
+        """Load denial candidates matching the record filter and build prior-case context."""
+
         reference_now = now or datetime.now(tz=UTC)
         window_start = reference_now - timedelta(days=7)
 
@@ -78,11 +116,10 @@ class SqlAlchemyPriorCaseQueries(PriorCaseQueryPort):
             cases.c.appointment_decided_at,
             cases.c.appointment_reason,
         ).where(
-            cases.c.agency_record_number == agency_record_number,
+            record_number_filter,
             cases.c.case_id != case_id,
             denial_window_filter,
         )
-
         async with self._session_factory() as session:
             result = await session.execute(statement)
 
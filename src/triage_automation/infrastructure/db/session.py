@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import json
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _serialize_json_column(value: object) -> str:
+    """Encode JSON column values compactly, skipping the encoder for empty payloads."""
+
+    if isinstance(value, dict) and not value:
+        return "{}"
+    return _JSON_ENCODER.encode(value)
+
 
 def create_session_factory(database_url: str) -> async_sessionmaker[AsyncSession]:
     """Create a reusable async session factory for the provided database URL."""
 
-    engine = create_async_engine(database_url)
+    engine = create_async_engine(database_url, json_serializer=_serialize_json_column)
     return async_sessionmaker(engine, expire_on_commit=False)
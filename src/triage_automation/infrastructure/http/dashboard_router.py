@@ -47,6 +47,9 @@ _SCHEDULE_LABEL_RE = re.compile(
 )
 _SCHEDULE_ISO_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2})?\b")
 _SCHEDULE_BR_RE = re.compile(r"\b\d{2}/\d{2}/\d{4}(?:\s+\d{2}:\d{2})?\b")
+_EXCERPT_LIMIT = 180
+# Same output as json.dumps(..., ensure_ascii=False, sort_keys=True), but iterable.
+_PAYLOAD_TEXT_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
 
 
 def build_dashboard_router(
@@ -174,8 +177,20 @@ def build_dashboard_router(
 
         timeline_rows: list[dict[str, object]] = []
         for item in detail.timeline:
-            full_text = _extract_full_text(content_text=item.content_text, payload=item.payload)
-            excerpt_text = _build_excerpt(full_text)
+            full_text: str | None
+            if can_view_full_content:
+                full_text = _extract_full_text(
+                    content_text=item.content_text,
+                    payload=item.payload,
+                )
+                excerpt_text = _build_excerpt(full_text)
+                is_truncated = len(excerpt_text) < len(full_text)
+            else:
+                full_text = None
+                excerpt_text, is_truncated = _build_event_excerpt(
+                    content_text=item.content_text,
+                    payload=item.payload,
+                )
             timeline_rows.append(
                 {
                     "timestamp": item.timestamp.isoformat(),
@@ -187,9 +202,9 @@ def build_dashboard_router(
                     "event_type": _translate_event_type(item.event_type),
                     "event_badge_class": _event_badge_class(item.event_type),
                     "excerpt_text": excerpt_text,
-                    "full_text": full_text if can_view_full_content else None,
+                    "full_text": full_text,
                     "can_show_full_content": can_view_full_content,
-                    "is_truncated": len(excerpt_text) < len(full_text),
+                    "is_truncated": is_truncated,
                 }
             )
 
@@ -601,11 +616,44 @@ def _extract_full_text(*, content_text: str | None, payload: dict[str, object] |
 def _build_excerpt(full_text: str) -> str:
     """Return fixed-size excerpt text for timeline cards."""
 
-    limit = 180
     normalized = " ".join(full_text.split())
-    if len(normalized) <= limit:
+    if len(normalized) <= _EXCERPT_LIMIT:
         return normalized
-    return f"{normalized[:limit].rstrip()}..."
+    return f"{normalized[:_EXCERPT_LIMIT].rstrip()}..."
+
+
+def _build_event_excerpt(
+    *,
+    content_text: str | None,
+    payload: dict[str, object] | None,
+) -> tuple[str, bool]:
+    """Return excerpt and truncation flag without serializing whole payloads."""
+
+    if payload is None or (content_text is not None and content_text.strip()):
+        full_text = _extract_full_text(content_text=content_text, payload=payload)
+        excerpt_text = _build_excerpt(full_text)
+        return excerpt_text, len(excerpt_text) < len(full_text)
+
+    # Longer than any excerpt ("..." included), so stopping early still flags truncation.
+    prefix = _serialize_payload_prefix(payload, min_normalized_length=_EXCERPT_LIMIT + 3)
+    excerpt_text = _build_excerpt(prefix)
+    return excerpt_text, len(excerpt_text) < len(prefix)
+
+
+def _serialize_payload_prefix(payload: dict[str, object], *, min_normalized_length: int) -> str:
+    """Serialize payload JSON only until its normalized text exceeds the requested length."""
+
+    chunks: list[str] = []
+    size = 0
+    for chunk in _PAYLOAD_TEXT_ENCODER.iterencode(payload):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size <= min_normalized_length:
+            continue
+        prefix = "".join(chunks)
+        if len(" ".join(prefix.split())) > min_normalized_length:
+            return prefix
+    return "".join(chunks)
 
 
 async def _require_audit_user(
@@ -6,13 +6,12 @@ from datetime import date
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
 
 from triage_automation.application.dto.monitoring_models import (
     MonitoringCaseDetailResponse,
-    MonitoringCaseListItem,
     MonitoringCaseListQueryParams,
     MonitoringCaseListResponse,
-    MonitoringCaseTimelineItem,
 )
 from triage_automation.application.services.access_guard_service import (
     RoleNotAuthorizedError,
@@ -49,7 +48,7 @@ def build_monitoring_router(
         status: CaseStatus | None = None,
         from_date: date | None = None,
         to_date: date | None = None,
-    ) -> MonitoringCaseListResponse:
+    ) -> Response:
         try:
             await auth_guard.require_audit_user(
                 authorization_header=request.headers.get("authorization"),
@@ -84,22 +83,13 @@ def build_monitoring_router(
         except InvalidMonitoringPeriodError as exc:
             raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-        return MonitoringCaseListResponse(
-            items=[
-                MonitoringCaseListItem(
-                    case_id=item.case_id,
-                    status=item.status,
-                    latest_activity_at=item.latest_activity_at,
-                )
-                for item in result.items
-            ],
-            page=result.page,
-            page_size=result.page_size,
-            total=result.total,
+        return Response(
+            content=MonitoringCaseListResponse.from_repository_page(result).model_dump_json(),
+            media_type="application/json",
         )
 
     @router.get("/monitoring/cases/{case_id}", response_model=MonitoringCaseDetailResponse)
-    async def get_case_detail(request: Request, case_id: UUID) -> MonitoringCaseDetailResponse:
+    async def get_case_detail(request: Request, case_id: UUID) -> Response:
         try:
             await auth_guard.require_audit_user(
                 authorization_header=request.headers.get("authorization"),
@@ -118,22 +108,11 @@ def build_monitoring_router(
         if detail is None:
             raise HTTPException(status_code=404, detail="case not found")
 
-        return MonitoringCaseDetailResponse(
-            case_id=detail.case_id,
-            status=detail.status,
-            timeline=[
-                MonitoringCaseTimelineItem(
-                    source=item.source,
-                    channel=item.channel,
-                    timestamp=item.timestamp,
-                    room_id=item.room_id,
-                    actor=item.actor,
-                    event_type=item.event_type,
-                    content_text=item.content_text,
-                    payload=item.payload,
-                )
-                for item in detail.timeline
-            ],
+        # Serialize the trusted model once instead of letting response_model
+        # re-validate every timeline entry.
+        return Response(
+            content=MonitoringCaseDetailResponse.from_repository_detail(detail).model_dump_json(),
+            media_type="application/json",
         )
 
     return router
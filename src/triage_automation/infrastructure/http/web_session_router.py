@@ -20,6 +20,7 @@ from triage_automation.application.services.access_guard_service import (
     UnknownRoleAuthorizationError,
 )
 from triage_automation.application.services.auth_service import AuthOutcome, AuthService
+from triage_automation.domain.auth.credentials import normalize_user_email
 from triage_automation.infrastructure.http.auth_guard import (
     SESSION_COOKIE_NAME,
     InvalidAuthTokenError,
@@ -270,6 +271,9 @@ async def _parse_login_form(request: Request) -> dict[str, str]:
 
     body = await request.body()
     parsed = parse_qs(body.decode("utf-8"), keep_blank_values=True)
-    email = parsed.get("email", [""])[0].strip().lower()
+    try:
+        email = normalize_user_email(email=parsed.get("email", [""])[0])
+    except ValueError:
+        email = ""
     password = parsed.get("password", [""])[0]
     return {"email": email, "password": password}
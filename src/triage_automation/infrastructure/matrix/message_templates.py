@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from html import escape
 from uuid import UUID
@@ -27,6 +28,7 @@ INFORMATIONAL_CASE_ID_TEMPLATE_BUILDERS: tuple[str, ...] = (
     "build_room2_case_pdf_attachment_filename",
     "build_room2_case_summary_message",
     "build_room2_case_summary_formatted_html",
+    "build_room2_case_summary_bodies",
     "build_room2_case_decision_instructions_message",
     "build_room2_case_decision_instructions_formatted_html",
     "build_room2_ack_message",
@@ -238,133 +240,194 @@ def build_room2_case_summary_message(
     """Build Room-2 message II body using markdown-like section headings."""
 
     _ = case_id
-    summary_lines = _build_room2_clinical_summary_lines(summary_text)
-    summary_block = "\n".join(summary_lines)
-    findings_block = "\n".join(_build_room2_critical_findings_lines(structured_data))
-    pending_block = "\n".join(_build_room2_critical_pending_lines(structured_data))
-    decision_block = "\n".join(_build_room2_decision_lines(suggested_action))
-    support_block = "\n".join(_build_room2_support_lines(suggested_action))
-    reason_block = "\n".join(_build_room2_objective_reason_lines(suggested_action))
-    conduct_block = "\n".join(
-        _build_room2_conduct_lines(
+    sections = _build_room2_summary_sections(
+        structured_data=structured_data,
+        summary_text=summary_text,
+        suggested_action=suggested_action,
+        recent_denial_context=recent_denial_context,
+    )
+    return _render_room2_summary_markdown(
+        sections,
+        agency_record_number=agency_record_number,
+        patient_name=patient_name,
+    )
+
+
+def build_room2_case_summary_formatted_html(
+    *,
+    case_id: UUID,
+    agency_record_number: str | None = None,
+    patient_name: str | None = None,
+    structured_data: dict[str, object],
+    summary_text: str,
+    suggested_action: dict[str, object],
+    recent_denial_context: dict[str, object] | None = None,
+) -> str:
+    """Build Room-2 message II HTML payload for Matrix formatted_body rendering."""
+
+    _ = case_id
+    sections = _build_room2_summary_sections(
+        structured_data=structured_data,
+        summary_text=summary_text,
+        suggested_action=suggested_action,
+        recent_denial_context=recent_denial_context,
+    )
+    return _render_room2_summary_html(
+        sections,
+        agency_record_number=agency_record_number,
+        patient_name=patient_name,
+    )
+
+
+def build_room2_case_summary_bodies(
+    *,
+    case_id: UUID,
+    agency_record_number: str | None = None,
+    patient_name: str | None = None,
+    structured_data: dict[str, object],
+    summary_text: str,
+    suggested_action: dict[str, object],
+    recent_denial_context: dict[str, object] | None = None,
+) -> tuple[str, str]:
+    """Build Room-2 message II plain body and HTML payload from one section pass."""
+
+    _ = case_id
+    sections = _build_room2_summary_sections(
+        structured_data=structured_data,
+        summary_text=summary_text,
+        suggested_action=suggested_action,
+        recent_denial_context=recent_denial_context,
+    )
+    return (
+        _render_room2_summary_markdown(
+            sections,
+            agency_record_number=agency_record_number,
+            patient_name=patient_name,
+        ),
+        _render_room2_summary_html(
+            sections,
+            agency_record_number=agency_record_number,
+            patient_name=patient_name,
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _Room2SummarySections:
+    """Section lines shared by the plain and HTML Room-2 summary renderings."""
+
+    summary: list[str]
+    findings: list[str]
+    pending: list[str]
+    decision: list[str]
+    support: list[str]
+    reason: list[str]
+    conduct: list[str]
+    recent_denial: list[str] | None
+
+
+def _build_room2_summary_sections(
+    *,
+    structured_data: dict[str, object],
+    summary_text: str,
+    suggested_action: dict[str, object],
+    recent_denial_context: dict[str, object] | None,
+) -> _Room2SummarySections:
+    """Derive every Room-2 summary section from the case payloads exactly once."""
+
+    return _Room2SummarySections(
+        summary=_build_room2_clinical_summary_lines(summary_text),
+        findings=_build_room2_critical_findings_lines(structured_data),
+        pending=_build_room2_critical_pending_lines(structured_data),
+        decision=_build_room2_decision_lines(suggested_action),
+        support=_build_room2_support_lines(suggested_action),
+        reason=_build_room2_objective_reason_lines(suggested_action),
+        conduct=_build_room2_conduct_lines(
             suggested_action=suggested_action,
             structured_data=structured_data,
             summary_text=summary_text,
-        )
+        ),
+        recent_denial=(
+            _build_room2_recent_denial_lines(recent_denial_context)
+            if recent_denial_context is not None
+            else None
+        ),
     )
-    recent_denial_block = _build_room2_recent_denial_markdown_block(recent_denial_context)
+
+
+def _render_room2_summary_markdown(
+    sections: _Room2SummarySections,
+    *,
+    agency_record_number: str | None,
+    patient_name: str | None,
+) -> str:
+    """Render Room-2 summary sections as the plain-text message body."""
+
     identification_block = build_human_identification_block(
         agency_record_number=agency_record_number,
         patient_name=patient_name,
     )
-
     message = (
         "# Resumo técnico da triagem\n\n"
         f"{identification_block}\n\n"
         "## Resumo clínico:\n\n"
-        f"{summary_block}\n\n"
+        f"{'\n'.join(sections.summary)}\n\n"
         "## Achados críticos:\n\n"
-        f"{findings_block}\n\n"
+        f"{'\n'.join(sections.findings)}\n\n"
         "## Pendências críticas:\n\n"
-        f"{pending_block}\n\n"
+        f"{'\n'.join(sections.pending)}\n\n"
         "## Decisão sugerida:\n\n"
-        f"{decision_block}\n\n"
+        f"{'\n'.join(sections.decision)}\n\n"
         "## Suporte recomendado:\n\n"
-        f"{support_block}\n\n"
+        f"{'\n'.join(sections.support)}\n\n"
         "## Motivo objetivo:\n\n"
-        f"{reason_block}\n\n"
+        f"{'\n'.join(sections.reason)}\n\n"
         "## Conduta sugerida:\n\n"
-        f"{conduct_block}"
+        f"{'\n'.join(sections.conduct)}"
     )
-    if recent_denial_block is not None:
-        message = f"{message}\n\n{recent_denial_block}"
+    if sections.recent_denial is not None:
+        recent_denial_block = "\n".join(sections.recent_denial)
+        message = f"{message}\n\n## Histórico de negativa recente:\n\n{recent_denial_block}"
     return message
 
 
-def build_room2_case_summary_formatted_html(
+def _render_room2_summary_html(
+    sections: _Room2SummarySections,
     *,
-    case_id: UUID,
-    agency_record_number: str | None = None,
-    patient_name: str | None = None,
-    structured_data: dict[str, object],
-    summary_text: str,
-    suggested_action: dict[str, object],
-    recent_denial_context: dict[str, object] | None = None,
+    agency_record_number: str | None,
+    patient_name: str | None,
 ) -> str:
-    """Build Room-2 message II HTML payload for Matrix formatted_body rendering."""
+    """Render Room-2 summary sections as the Matrix formatted_body HTML."""
 
-    _ = case_id
-    summary_html = _format_room2_clinical_summary_html(summary_text)
-    findings_html = _format_markdown_lines_html(
-        _build_room2_critical_findings_lines(structured_data)
-    )
-    pending_html = _format_markdown_lines_html(
-        _build_room2_critical_pending_lines(structured_data)
-    )
-    decision_html = _format_markdown_lines_html(_build_room2_decision_lines(suggested_action))
-    support_html = _format_markdown_lines_html(_build_room2_support_lines(suggested_action))
-    reason_html = _format_markdown_lines_html(_build_room2_objective_reason_lines(suggested_action))
-    conduct_html = _format_markdown_lines_html(
-        _build_room2_conduct_lines(
-            suggested_action=suggested_action,
-            structured_data=structured_data,
-            summary_text=summary_text,
-        )
-    )
-    recent_denial_html = _build_room2_recent_denial_html_block(recent_denial_context)
     identification_html = _build_human_identification_html(
         agency_record_number=agency_record_number,
         patient_name=patient_name,
     )
-
+    summary_html = "".join(f"<p>{escape(line)}</p>" for line in sections.summary)
     formatted = (
         "<h1>Resumo técnico da triagem</h1>"
         f"{identification_html}"
         "<h2>Resumo clínico:</h2>"
         f"{summary_html}"
         "<h2>Achados críticos:</h2>"
-        f"{findings_html}"
+        f"{_format_markdown_lines_html(sections.findings)}"
         "<h2>Pendências críticas:</h2>"
-        f"{pending_html}"
+        f"{_format_markdown_lines_html(sections.pending)}"
         "<h2>Decisão sugerida:</h2>"
-        f"{decision_html}"
+        f"{_format_markdown_lines_html(sections.decision)}"
         "<h2>Suporte recomendado:</h2>"
-        f"{support_html}"
+        f"{_format_markdown_lines_html(sections.support)}"
         "<h2>Motivo objetivo:</h2>"
-        f"{reason_html}"
+        f"{_format_markdown_lines_html(sections.reason)}"
         "<h2>Conduta sugerida:</h2>"
-        f"{conduct_html}"
+        f"{_format_markdown_lines_html(sections.conduct)}"
     )
-    if recent_denial_html is not None:
+    if sections.recent_denial is not None:
+        recent_denial_html = _format_markdown_lines_html(sections.recent_denial)
         formatted = f"{formatted}<h2>Histórico de negativa recente:</h2>{recent_denial_html}"
     return formatted
 
 
-def _build_room2_recent_denial_markdown_block(
-    recent_denial_context: dict[str, object] | None,
-) -> str | None:
-    """Return optional markdown section for recent denial context in Room-2 summary."""
-
-    if recent_denial_context is None:
-        return None
-
-    lines = _build_room2_recent_denial_lines(recent_denial_context)
-    block_body = "\n".join(lines)
-    return "## Histórico de negativa recente:\n\n" f"{block_body}"
-
-
-def _build_room2_recent_denial_html_block(
-    recent_denial_context: dict[str, object] | None,
-) -> str | None:
-    """Return optional HTML section body for recent denial context in Room-2 summary."""
-
-    if recent_denial_context is None:
-        return None
-
-    lines = _build_room2_recent_denial_lines(recent_denial_context)
-    return _format_markdown_lines_html(lines)
-
-
 def _build_room2_recent_denial_lines(
     recent_denial_context: dict[str, object],
 ) -> list[str]:
@@ -478,13 +541,6 @@ def _build_room2_clinical_summary_lines(summary_text: str) -> list[str]:
     ]
 
 
-def _format_room2_clinical_summary_html(summary_text: str) -> str:
-    """Render normalized clinical summary lines as HTML paragraphs."""
-
-    lines = _build_room2_clinical_summary_lines(summary_text)
-    return "".join(f"<p>{escape(line)}</p>" for line in lines)
-
-
 def _build_room2_critical_findings_lines(structured_data: dict[str, object]) -> list[str]:
     """Return concise critical findings section lines."""
 
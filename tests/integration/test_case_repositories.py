@@ -12,13 +12,17 @@ from alembic import command
 from triage_automation.application.ports.audit_repository_port import AuditEventCreateInput
 from triage_automation.application.ports.case_repository_port import (
     CaseCreateInput,
+    DoctorDecisionUpdateInput,
     DuplicateCaseOriginEventError,
 )
 from triage_automation.application.ports.message_repository_port import (
+    CaseMatrixMessageTranscriptCreateInput,
     CaseMessageCreateInput,
+    CaseMessageRef,
     DuplicateCaseMessageError,
 )
 from triage_automation.domain.case_status import CaseStatus
+from triage_automation.infrastructure.db import message_repository
 from triage_automation.infrastructure.db.audit_repository import SqlAlchemyAuditRepository
 from triage_automation.infrastructure.db.case_repository import SqlAlchemyCaseRepository
 from triage_automation.infrastructure.db.message_repository import SqlAlchemyMessageRepository
@@ -129,6 +133,56 @@ async def test_append_only_audit_event_persistence(tmp_path: Path) -> None:
     assert row["event_type"] == "CASE_CREATED"
 
 
+@pytest.mark.asyncio
+async def test_bulk_audit_event_append_preserves_order(tmp_path: Path) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "audit_bulk_insert.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+    audit_repo = SqlAlchemyAuditRepository(session_factory)
+
+    case_id = uuid4()
+    await case_repo.create_case(
+        CaseCreateInput(
+            case_id=case_id,
+            status=CaseStatus.NEW,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$event-audit-bulk",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+
+    await audit_repo.append_events([])
+    await audit_repo.append_events(
+        [
+            AuditEventCreateInput(
+                case_id=case_id,
+                actor_type="system",
+                room_id="!room1:example.org",
+                matrix_event_id=f"$redacted-{index}",
+                event_type="MATRIX_EVENT_REDACTED",
+            )
+            for index in range(3)
+        ]
+    )
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        rows = connection.execute(
+            sa.text(
+                "SELECT matrix_event_id, event_type FROM case_events "
+                "WHERE case_id = :case_id ORDER BY id"
+            ),
+            {"case_id": case_id.hex},
+        ).mappings().all()
+
+    assert [row["matrix_event_id"] for row in rows] == [
+        "$redacted-0",
+        "$redacted-1",
+        "$redacted-2",
+    ]
+    assert {row["event_type"] for row in rows} == {"MATRIX_EVENT_REDACTED"}
+
+
 @pytest.mark.asyncio
 async def test_duplicate_case_message_room_event_is_rejected_safely(tmp_path: Path) -> None:
     sync_url, async_url = _upgrade_head(tmp_path, "message_duplicate.db")
@@ -181,6 +235,110 @@ async def test_duplicate_case_message_room_event_is_rejected_safely(tmp_path: Pa
     assert count == 1
 
 
+@pytest.mark.asyncio
+async def test_message_with_transcript_is_written_atomically(tmp_path: Path) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "message_with_transcript.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+    message_repo = SqlAlchemyMessageRepository(session_factory)
+
+    case_id = uuid4()
+    await case_repo.create_case(
+        CaseCreateInput(
+            case_id=case_id,
+            status=CaseStatus.WAIT_DOCTOR,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$event-ack",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    message = CaseMessageCreateInput(
+        case_id=case_id,
+        room_id="!room2:example.org",
+        event_id="$ack-1",
+        kind="room2_decision_ack",
+    )
+    transcript = CaseMatrixMessageTranscriptCreateInput(
+        case_id=case_id,
+        room_id="!room2:example.org",
+        event_id="$ack-1",
+        sender="bot",
+        message_type="room2_decision_ack",
+        message_text="resultado: sucesso",
+    )
+
+    message_id = await message_repo.add_message_with_transcript(message, transcript)
+    with pytest.raises(DuplicateCaseMessageError):
+        await message_repo.add_message_with_transcript(message, transcript)
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        message_ids = connection.execute(
+            sa.text("SELECT id FROM case_messages WHERE event_id = '$ack-1'")
+        ).scalars().all()
+        transcript_count = connection.execute(
+            sa.text(
+                "SELECT COUNT(*) FROM case_matrix_message_transcripts "
+                "WHERE event_id = '$ack-1'"
+            )
+        ).scalar_one()
+
+    assert message_ids == [message_id]
+    assert transcript_count == 1
+
+
+@pytest.mark.asyncio
+async def test_message_refs_stream_across_pages_in_insertion_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _, async_url = _upgrade_head(tmp_path, "message_refs_stream.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+    message_repo = SqlAlchemyMessageRepository(session_factory)
+    monkeypatch.setattr(message_repository, "_MESSAGE_REF_PAGE_SIZE", 2)
+
+    case_id = uuid4()
+    other_case_id = uuid4()
+    for target_case_id, origin_event_id in (
+        (case_id, "$event-stream"),
+        (other_case_id, "$event-stream-other"),
+    ):
+        await case_repo.create_case(
+            CaseCreateInput(
+                case_id=target_case_id,
+                status=CaseStatus.CLEANUP_RUNNING,
+                room1_origin_room_id="!room1:example.org",
+                room1_origin_event_id=origin_event_id,
+                room1_sender_user_id="@human:example.org",
+            )
+        )
+    await message_repo.add_message(
+        CaseMessageCreateInput(
+            case_id=other_case_id,
+            room_id="!room1:example.org",
+            event_id="$other-case-message",
+            kind="bot_processing",
+        )
+    )
+    for index in range(4):
+        await message_repo.add_message(
+            CaseMessageCreateInput(
+                case_id=case_id,
+                room_id="!room1:example.org",
+                event_id=f"$stream-{index}",
+                kind="bot_processing",
+            )
+        )
+
+    refs = [ref async for ref in message_repo.iter_message_refs_for_case(case_id=case_id)]
+
+    assert refs == [
+        CaseMessageRef(room_id="!room1:example.org", event_id=f"$stream-{index}")
+        for index in range(4)
+    ]
+
+
 @pytest.mark.asyncio
 async def test_full_transcript_persistence_and_chronological_timeline_per_case(
     tmp_path: Path,
@@ -296,3 +454,111 @@ async def test_full_transcript_persistence_and_chronological_timeline_per_case(
         "event_id": "$evt-target-reply",
         "reply_to_event_id": "$evt-target-root",
     }
+
+
+@pytest.mark.asyncio
+async def test_apply_doctor_decision_reports_outcome_in_one_call(tmp_path: Path) -> None:
+    _, async_url = _upgrade_head(tmp_path, "doctor_decision_apply.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+
+    case_id = uuid4()
+    await case_repo.create_case(
+        CaseCreateInput(
+            case_id=case_id,
+            status=CaseStatus.WAIT_DOCTOR,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$event-doctor-apply",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    decision = DoctorDecisionUpdateInput(
+        case_id=case_id,
+        doctor_user_id="@doctor:example.org",
+        decision="accept",
+        support_flag="none",
+        reason=None,
+    )
+
+    applied = await case_repo.apply_doctor_decision(decision)
+    repeated = await case_repo.apply_doctor_decision(decision)
+    missing = await case_repo.apply_doctor_decision(
+        DoctorDecisionUpdateInput(
+            case_id=uuid4(),
+            doctor_user_id="@doctor:example.org",
+            decision="deny",
+            support_flag="none",
+            reason=None,
+        )
+    )
+
+    undecided_case_id = uuid4()
+    await case_repo.create_case(
+        CaseCreateInput(
+            case_id=undecided_case_id,
+            status=CaseStatus.LLM_SUGGEST,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$event-doctor-apply-undecided",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    not_waiting = await case_repo.apply_doctor_decision(
+        DoctorDecisionUpdateInput(
+            case_id=undecided_case_id,
+            doctor_user_id="@doctor:example.org",
+            decision="accept",
+            support_flag="none",
+            reason=None,
+        )
+    )
+
+    assert applied.outcome == "applied"
+    assert applied.current_status is CaseStatus.DOCTOR_ACCEPTED
+    assert repeated.outcome == "duplicate"
+    assert not_waiting.outcome == "wrong_state"
+    assert not_waiting.current_status is CaseStatus.LLM_SUGGEST
+    assert repeated.current_status is CaseStatus.DOCTOR_ACCEPTED
+    assert missing.outcome == "not_found"
+    assert missing.current_status is None
+
+
+@pytest.mark.asyncio
+async def test_transition_status_is_guarded_and_returns_prior_status(tmp_path: Path) -> None:
+    _, async_url = _upgrade_head(tmp_path, "case_transition_status.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+
+    case_id = uuid4()
+    await case_repo.create_case(
+        CaseCreateInput(
+            case_id=case_id,
+            status=CaseStatus.LLM_SUGGEST,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$event-transition",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    postable = frozenset({CaseStatus.LLM_SUGGEST, CaseStatus.R2_POST_WIDGET})
+
+    moved_from = await case_repo.transition_status(
+        case_id=case_id,
+        from_statuses=postable,
+        to_status=CaseStatus.WAIT_DOCTOR,
+    )
+    repeated = await case_repo.transition_status(
+        case_id=case_id,
+        from_statuses=postable,
+        to_status=CaseStatus.FAILED,
+    )
+    missing = await case_repo.transition_status(
+        case_id=uuid4(),
+        from_statuses=postable,
+        to_status=CaseStatus.WAIT_DOCTOR,
+    )
+    snapshot = await case_repo.get_case_room2_widget_snapshot(case_id=case_id)
+
+    assert moved_from is CaseStatus.LLM_SUGGEST
+    assert repeated is None
+    assert missing is None
+    assert snapshot is not None
+    assert snapshot.status is CaseStatus.WAIT_DOCTOR
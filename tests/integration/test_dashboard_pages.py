@@ -387,6 +387,57 @@ async def test_dashboard_case_list_prefers_patient_name_and_record_number_identi
     assert f'href="/dashboard/cases/{case_id}"' in response.text
 
 
+@pytest.mark.asyncio
+async def test_dashboard_case_list_reads_portuguese_patient_name_keys(
+    tmp_path: Path,
+) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_patient_ptbr_keys.db")
+    token_service = OpaqueTokenService()
+    reader_id = uuid4()
+    reader_token = "reader-dashboard-patient-ptbr-token"
+    now = datetime(2026, 2, 18, 12, 0, 0, tzinfo=UTC)
+    case_id = uuid4()
+    filter_date = now.date().isoformat()
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
+        _insert_token(
+            connection,
+            token_service=token_service,
+            user_id=reader_id,
+            token=reader_token,
+        )
+        _insert_case(
+            connection,
+            case_id=case_id,
+            status="WAIT_DOCTOR",
+            updated_at=now - timedelta(minutes=20),
+            agency_record_number="654321",
+            structured_data_json={
+                "patient": None,
+                "paciente": {"name": "  ", "nome": " Joana Lima "},
+                "eda": {"indication_category": "dyspepsia"},
+            },
+        )
+        _insert_matrix_transcript(
+            connection,
+            case_id=case_id,
+            event_id="$evt-patient-ptbr",
+            captured_at=now - timedelta(minutes=5),
+        )
+
+    with _build_client(async_url, token_service=token_service) as client:
+        response = client.get(
+            "/dashboard/cases"
+            f"?from_date={filter_date}&to_date={filter_date}",
+            headers={"Authorization": f"Bearer {reader_token}"},
+        )
+
+    assert response.status_code == 200
+    assert "Joana Lima · 654321" in response.text
+
+
 @pytest.mark.asyncio
 async def test_dashboard_case_list_fragment_update_respects_filters_and_pagination(
     tmp_path: Path,
@@ -806,6 +857,60 @@ async def test_dashboard_case_detail_page_shows_excerpt_only_for_reader(tmp_path
     assert "trecho" in response.text
 
 
+@pytest.mark.asyncio
+async def test_dashboard_case_detail_page_truncates_large_llm_payload_for_reader(
+    tmp_path: Path,
+) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "dashboard_page_detail_reader_llm_payload.db")
+    token_service = OpaqueTokenService()
+    reader_id = uuid4()
+    reader_token = "reader-dashboard-detail-llm-payload"
+    case_id = uuid4()
+    base = datetime(2026, 2, 18, 11, 0, 0, tzinfo=UTC)
+    output_payload = {
+        "bullet_points": [f"ponto {index}" for index in range(200)],
+        "zz_tail": "SEGREDO_PAYLOAD_TAIL_123",
+    }
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        _insert_user(connection, user_id=reader_id, email="reader@example.org", role="reader")
+        _insert_token(
+            connection,
+            token_service=token_service,
+            user_id=reader_id,
+            token=reader_token,
+        )
+        _insert_case(
+            connection,
+            case_id=case_id,
+            status="WAIT_DOCTOR",
+            updated_at=base - timedelta(minutes=10),
+        )
+        connection.execute(
+            sa.text(
+                "INSERT INTO case_llm_interactions ("
+                "case_id, stage, input_payload, output_payload, captured_at"
+                ") VALUES (:case_id, 'LLM1', '{}', :output_payload, :captured_at)"
+            ),
+            {
+                "case_id": case_id.hex,
+                "output_payload": json.dumps(output_payload),
+                "captured_at": base,
+            },
+        )
+
+    with _build_client(async_url, token_service=token_service) as client:
+        response = client.get(
+            f"/dashboard/cases/{case_id}?view=pure",
+            headers={"Authorization": f"Bearer {reader_token}"},
+        )
+
+    assert response.status_code == 200
+    assert "ponto 0" in response.text
+    assert "SEGREDO_PAYLOAD_TAIL_123" not in response.text
+
+
 @pytest.mark.asyncio
 async def test_dashboard_case_detail_page_renders_reaction_checkpoint_timeline_events(
     tmp_path: Path,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from uuid import uuid4
@@ -59,6 +60,20 @@ class FakeRateLimitedRedactor:
         )
 
 
+class FakeConcurrencyTrackingRedactor:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls: list[tuple[str, str]] = []
+
+    async def redact_event(self, *, room_id: str, event_id: str) -> None:
+        self.calls.append((room_id, event_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+
 def _upgrade_head(tmp_path: Path, filename: str) -> tuple[str, str]:
     db_path = tmp_path / filename
     sync_url = f"sqlite+pysqlite:///{db_path}"
@@ -258,3 +273,62 @@ async def test_cleanup_retries_matrix_rate_limit_and_completes(tmp_path: Path) -
     assert case_row["status"] == "CLEANED"
     assert list(event_types).count("MATRIX_EVENT_REDACTED") == 1
     assert list(event_types).count("MATRIX_EVENT_REDACTION_FAILED") == 0
+
+
+@pytest.mark.asyncio
+async def test_cleanup_runs_redactions_concurrently_within_bound(tmp_path: Path) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "cleanup_execute_concurrent.db")
+    session_factory = create_session_factory(async_url)
+
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+    audit_repo = SqlAlchemyAuditRepository(session_factory)
+    message_repo = SqlAlchemyMessageRepository(session_factory)
+
+    created_case = await case_repo.create_case(
+        CaseCreateInput(
+            case_id=uuid4(),
+            status=CaseStatus.CLEANUP_RUNNING,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$origin-cleanup-concurrent",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    for index in range(5):
+        await message_repo.add_message(
+            CaseMessageCreateInput(
+                case_id=created_case.case_id,
+                room_id="!room2:example.org",
+                event_id=f"$room2-concurrent-{index}",
+                kind="bot_widget",
+                sender_user_id=None,
+            )
+        )
+
+    redactor = FakeConcurrencyTrackingRedactor()
+    service = ExecuteCleanupService(
+        case_repository=case_repo,
+        audit_repository=audit_repo,
+        message_repository=message_repo,
+        matrix_redactor=redactor,
+        max_concurrent_redactions=2,
+    )
+
+    result = await service.execute(case_id=created_case.case_id)
+
+    assert result.redacted_success == 5
+    assert result.redacted_failed == 0
+    assert len(redactor.calls) == 5
+    assert redactor.max_in_flight == 2
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        event_types = connection.execute(
+            sa.text(
+                "SELECT event_type FROM case_events "
+                "WHERE case_id = :case_id ORDER BY id"
+            ),
+            {"case_id": created_case.case_id.hex},
+        ).scalars().all()
+
+    assert list(event_types).count("MATRIX_EVENT_REDACTED") == 5
+    assert list(event_types)[-1] == "CLEANUP_COMPLETED"
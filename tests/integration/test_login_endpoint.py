@@ -133,6 +133,32 @@ async def test_valid_credentials_return_opaque_token_role_and_persist_hash(tmp_p
     assert auth_token["token_hash"] == token_service.hash_token("opaque-token-value")
 
 
+@pytest.mark.asyncio
+async def test_login_normalizes_email_case_and_whitespace(tmp_path: Path) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "login_normalized_email.db")
+    hasher = BcryptPasswordHasher()
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        _insert_user(
+            connection,
+            user_id=uuid4(),
+            email="admin@example.org",
+            password_hash=hasher.hash_password("correct-password"),
+            role="admin",
+            is_active=True,
+        )
+
+    with _build_client(async_url) as client:
+        response = client.post(
+            "/auth/login",
+            json={"email": "  Admin@Example.ORG ", "password": "correct-password"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["role"] == "admin"
+
+
 @pytest.mark.asyncio
 async def test_invalid_credentials_return_auth_error_and_no_token_row(tmp_path: Path) -> None:
     sync_url, async_url = _upgrade_head(tmp_path, "login_invalid.db")
@@ -255,3 +281,41 @@ async def test_legacy_callback_and_widget_endpoints_are_absent(tmp_path: Path) -
         assert client.get("/widget/room2/styles.css").status_code == 404
         assert client.get("/widget/room2/bootstrap").status_code == 404
         assert client.post("/widget/room2/submit", json={}).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_login_rejects_user_deactivated_after_previous_successful_login(
+    tmp_path: Path,
+) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "login_deactivated.db")
+    user_id = uuid4()
+    hasher = BcryptPasswordHasher()
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        _insert_user(
+            connection,
+            user_id=user_id,
+            email="reader@example.org",
+            password_hash=hasher.hash_password("reader-password"),
+            role="reader",
+            is_active=True,
+        )
+
+    login = {"email": "reader@example.org", "password": "reader-password"}
+    with _build_client(async_url) as client:
+        assert client.post("/auth/login", json=login).status_code == 200
+
+        # Deactivated outside this app instance, as another process or admin would.
+        with engine.begin() as connection:
+            connection.execute(
+                sa.text(
+                    "UPDATE users SET is_active = 0, account_status = 'blocked' WHERE id = :id"
+                ),
+                {"id": user_id.hex},
+            )
+
+        response = client.post("/auth/login", json=login)
+
+    assert response.status_code == 403
+    assert response.json() == {"detail": "inactive user"}
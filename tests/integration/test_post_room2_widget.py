@@ -234,6 +234,18 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
         suggested_action_json=_suggested_action(current_case.case_id, "12345"),
     )
 
+    by_case_id = await prior_queries.lookup_recent_context_by_case_id(
+        case_id=current_case.case_id,
+        now=now,
+    )
+    assert by_case_id == await prior_queries.lookup_recent_context(
+        case_id=current_case.case_id,
+        agency_record_number="12345",
+        now=now,
+    )
+    assert by_case_id.prior_case is not None
+    assert by_case_id.prior_case.prior_case_id == prior_case.case_id
+
     service = PostRoom2WidgetService(
         room2_id="!room2:example.org",
         widget_public_base_url="https://bot-api.example.org",
@@ -375,6 +387,14 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
             ),
             {"case_id": current_case.case_id.hex},
         ).scalar_one()
+        status_event_payloads = connection.execute(
+            sa.text(
+                "SELECT payload FROM case_events "
+                "WHERE case_id = :case_id AND event_type = 'CASE_STATUS_CHANGED' "
+                "ORDER BY id"
+            ),
+            {"case_id": current_case.case_id.hex},
+        ).scalars().all()
         widget_post_payload = connection.execute(
             sa.text(
                 "SELECT payload FROM case_events "
@@ -441,6 +461,13 @@ async def test_post_room2_widget_includes_prior_and_moves_to_wait_doctor(tmp_pat
         "from_status": "R2_POST_WIDGET",
         "to_status": "WAIT_DOCTOR",
     }
+    assert [
+        payload if isinstance(payload, dict) else json.loads(payload)
+        for payload in status_event_payloads[-2:]
+    ] == [
+        {"from_status": "LLM_SUGGEST", "to_status": "R2_POST_WIDGET"},
+        {"from_status": "R2_POST_WIDGET", "to_status": "WAIT_DOCTOR"},
+    ]
     parsed_widget_payload = (
         widget_post_payload
         if isinstance(widget_post_payload, dict)
@@ -548,3 +575,92 @@ async def test_post_room2_widget_omits_prior_denial_block_without_recent_denial(
     assert "Motivo da negativa mais recente" not in summary_body
     assert summary_formatted_body is not None
     assert "<h2>Histórico de negativa recente:</h2>" not in summary_formatted_body
+
+
+class FailingInstructionsMatrixPoster(FakeMatrixPoster):
+    async def reply_text(
+        self,
+        *,
+        room_id: str,
+        event_id: str,
+        body: str,
+        formatted_body: str | None = None,
+    ) -> str:
+        if len(self.reply_calls) == 1:
+            raise RuntimeError("matrix unavailable")
+        return await super().reply_text(
+            room_id=room_id,
+            event_id=event_id,
+            body=body,
+            formatted_body=formatted_body,
+        )
+
+
+@pytest.mark.asyncio
+async def test_post_room2_widget_records_summary_before_failed_next_post_is_raised(
+    tmp_path: Path,
+) -> None:
+    sync_url, async_url = _upgrade_head(tmp_path, "post_room2_widget_failure.db")
+    session_factory = create_session_factory(async_url)
+    case_repo = SqlAlchemyCaseRepository(session_factory)
+    matrix_poster = FailingInstructionsMatrixPoster()
+
+    case = await case_repo.create_case(
+        CaseCreateInput(
+            case_id=uuid4(),
+            status=CaseStatus.LLM_SUGGEST,
+            room1_origin_room_id="!room1:example.org",
+            room1_origin_event_id="$origin-failure",
+            room1_sender_user_id="@human:example.org",
+        )
+    )
+    await case_repo.store_pdf_extraction(
+        case_id=case.case_id,
+        pdf_mxc_url="mxc://example.org/current",
+        extracted_text="current text",
+        agency_record_number="12345",
+    )
+    await case_repo.store_llm1_artifacts(
+        case_id=case.case_id,
+        structured_data_json=_structured_data("12345"),
+        summary_text="Resumo LLM1",
+    )
+    await case_repo.store_llm2_artifacts(
+        case_id=case.case_id,
+        suggested_action_json=_suggested_action(case.case_id, "12345"),
+    )
+    service = PostRoom2WidgetService(
+        room2_id="!room2:example.org",
+        widget_public_base_url="https://bot-api.example.org",
+        case_repository=case_repo,
+        audit_repository=SqlAlchemyAuditRepository(session_factory),
+        message_repository=SqlAlchemyMessageRepository(session_factory),
+        prior_case_queries=SqlAlchemyPriorCaseQueries(session_factory),
+        matrix_poster=matrix_poster,
+    )
+
+    with pytest.raises(RuntimeError, match="matrix unavailable"):
+        await service.post_widget(case_id=case.case_id)
+
+    engine = sa.create_engine(sync_url)
+    with engine.begin() as connection:
+        kinds = connection.execute(
+            sa.text("SELECT kind FROM case_messages WHERE case_id = :case_id ORDER BY id"),
+            {"case_id": case.case_id.hex},
+        ).scalars().all()
+        status = connection.execute(
+            sa.text("SELECT status FROM cases WHERE case_id = :case_id"),
+            {"case_id": case.case_id.hex},
+        ).scalar_one()
+        event_types = connection.execute(
+            sa.text("SELECT event_type FROM case_events WHERE case_id = :case_id ORDER BY id"),
+            {"case_id": case.case_id.hex},
+        ).scalars().all()
+
+    assert kinds == ["room2_case_root", "room2_case_summary"]
+    assert event_types[-3:] == [
+        "PRIOR_CASE_LOOKUP_COMPLETED",
+        "ROOM2_WIDGET_POSTED",
+        "ROOM2_CASE_SUMMARY_POSTED",
+    ]
+    assert status == CaseStatus.LLM_SUGGEST.value
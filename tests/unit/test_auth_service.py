@@ -113,7 +113,7 @@ async def test_authenticate_invalid_password_logs_failure_event() -> None:
 
 
 @pytest.mark.asyncio
-async def test_authenticate_inactive_user_blocks_without_password_check() -> None:
+async def test_authenticate_inactive_user_blocks_after_uniform_password_check() -> None:
     user = _user(is_active=False)
     users = FakeUserRepository(user=user)
     auth_events = FakeAuthEventRepository()
@@ -129,7 +129,7 @@ async def test_authenticate_inactive_user_blocks_without_password_check() -> Non
 
     assert result.outcome is AuthOutcome.INACTIVE_USER
     assert result.user is None
-    assert hasher.verify_calls == []
+    assert hasher.verify_calls == [("pw", "hashed::pw")]
     assert len(auth_events.events) == 1
     event = auth_events.events[0]
     assert event.event_type == "login_blocked_inactive"
@@ -153,7 +153,9 @@ async def test_authenticate_unknown_user_logs_invalid_credentials() -> None:
 
     assert result.outcome is AuthOutcome.INVALID_CREDENTIALS
     assert result.user is None
-    assert hasher.verify_calls == []
+    assert len(hasher.verify_calls) == 1
+    assert hasher.verify_calls[0][0] == "pw"
+    assert hasher.verify_calls[0][1].startswith("hashed::")
     assert len(auth_events.events) == 1
     event = auth_events.events[0]
     assert event.event_type == "login_failed"
@@ -162,3 +164,23 @@ async def test_authenticate_unknown_user_logs_invalid_credentials() -> None:
         "email": "missing@example.com",
         "reason": "invalid_credentials",
     }
+
+
+@pytest.mark.asyncio
+async def test_authenticate_unknown_user_reuses_dummy_hash_and_never_succeeds() -> None:
+    users = FakeUserRepository(user=None)
+    auth_events = FakeAuthEventRepository()
+    hasher = FakePasswordHasher(should_verify=True)
+    service = AuthService(users=users, auth_events=auth_events, password_hasher=hasher)
+
+    for _ in range(2):
+        result = await service.authenticate(
+            email="missing@example.com",
+            password="pw",
+            ip_address=None,
+            user_agent=None,
+        )
+        assert result.outcome is AuthOutcome.INVALID_CREDENTIALS
+
+    assert len(hasher.verify_calls) == 2
+    assert hasher.verify_calls[0][1] == hasher.verify_calls[1][1]
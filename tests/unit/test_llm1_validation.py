@@ -4,7 +4,9 @@ import json
 from uuid import uuid4
 
 import pytest
+from pydantic import ValidationError
 
+from triage_automation.application.dto.llm1_models import Llm1Response
 from triage_automation.application.services.llm1_service import (
     Llm1RetriableError,
     Llm1Service,
@@ -118,6 +120,18 @@ async def test_invalid_schema_is_retriable_llm1_error() -> None:
     assert exc_info.value.cause == "llm1"
 
 
+@pytest.mark.parametrize("agency_record", ["1234", "1234a", "\uff11\uff12\uff13\uff14\uff15", ""])
+def test_llm1_schema_rejects_invalid_agency_record_number(agency_record: str) -> None:
+    with pytest.raises(ValidationError):
+        Llm1Response.model_validate(_valid_llm1_payload(agency_record))
+
+
+def test_llm1_schema_accepts_agency_record_number_with_five_or_more_digits() -> None:
+    for agency_record in ("12345", "1234567890"):
+        parsed = Llm1Response.model_validate(_valid_llm1_payload(agency_record))
+        assert parsed.agency_record_number == agency_record
+
+
 @pytest.mark.asyncio
 async def test_non_json_response_is_rejected() -> None:
     client = FakeLlmClient("not-json")
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from typing import cast
 from uuid import uuid4
 
 import pytest
 
+from triage_automation.application.ports.case_repository_port import (
+    CaseLlmInteractionCreateInput,
+    CaseRepositoryPort,
+)
 from triage_automation.application.services.llm2_service import (
     Llm2RetriableError,
     Llm2Service,
@@ -144,3 +150,141 @@ async def test_llm2_fails_when_english_terms_persist_after_retry() -> None:
     assert error_info.value.cause == "llm2"
     assert "non-ptbr narrative terms" in error_info.value.details
     assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_llm2_rejects_llm1_payload_missing_policy_sections_before_calling_llm() -> None:
+    case_id = uuid4()
+    agency_record_number = "12345"
+    llm1_payload = _valid_llm1_payload(agency_record_number)
+    del llm1_payload["policy_precheck"]
+    client = FakeLlmClient(json.dumps(_valid_llm2_payload(str(case_id), agency_record_number)))
+    service = Llm2Service(llm_client=client)
+
+    with pytest.raises(Llm2RetriableError) as error_info:
+        await service.run(
+            case_id=case_id,
+            agency_record_number=agency_record_number,
+            llm1_structured_data=llm1_payload,
+        )
+
+    assert "LLM1 payload invalid" in error_info.value.details
+    assert client.calls == []
+
+
+class RecordingInteractionRepository:
+    def __init__(self) -> None:
+        self.stages: list[str] = []
+
+    async def append_case_llm_interaction(self, payload: CaseLlmInteractionCreateInput) -> None:
+        await asyncio.sleep(0)
+        self.stages.append(payload.stage)
+
+
+@pytest.mark.asyncio
+async def test_llm2_interaction_captures_land_before_run_returns_or_raises() -> None:
+    case_id = uuid4()
+    agency_record_number = "12345"
+    repository = RecordingInteractionRepository()
+    response = json.dumps(_valid_llm2_payload(str(case_id), agency_record_number))
+    service = Llm2Service(llm_client=FakeLlmClient(response))
+
+    await service.run(
+        case_id=case_id,
+        agency_record_number=agency_record_number,
+        llm1_structured_data=_valid_llm1_payload(agency_record_number),
+        interaction_repository=cast(CaseRepositoryPort, repository),
+    )
+    assert repository.stages == ["LLM2"]
+
+    failing_service = Llm2Service(llm_client=FakeLlmClient("not json"))
+    with pytest.raises(Llm2RetriableError):
+        await failing_service.run(
+            case_id=case_id,
+            agency_record_number=agency_record_number,
+            llm1_structured_data=_valid_llm1_payload(agency_record_number),
+            interaction_repository=cast(CaseRepositoryPort, repository),
+        )
+    assert repository.stages == ["LLM2", "LLM2"]
+
+
+@pytest.mark.asyncio
+async def test_llm2_rejects_malformed_llm1_policy_values_before_calling_llm() -> None:
+    case_id = uuid4()
+    agency_record_number = "12345"
+    llm1_payload = _valid_llm1_payload(agency_record_number)
+    policy_precheck = llm1_payload["policy_precheck"]
+    assert isinstance(policy_precheck, dict)
+    policy_precheck["labs_pass"] = "maybe"
+    client = FakeLlmClient(json.dumps(_valid_llm2_payload(str(case_id), agency_record_number)))
+    service = Llm2Service(llm_client=client)
+
+    with pytest.raises(Llm2RetriableError) as error_info:
+        await service.run(
+            case_id=case_id,
+            agency_record_number=agency_record_number,
+            llm1_structured_data=llm1_payload,
+        )
+
+    assert "LLM1 payload invalid" in error_info.value.details
+    assert client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_llm2_normalized_suggestion_keeps_response_key_order() -> None:
+    case_id = uuid4()
+    agency_record_number = "12345"
+    llm2_payload = _valid_llm2_payload(str(case_id), agency_record_number)
+    client = FakeLlmClient(json.dumps(llm2_payload))
+    service = Llm2Service(llm_client=client)
+
+    result = await service.run(
+        case_id=case_id,
+        agency_record_number=agency_record_number,
+        llm1_structured_data=_valid_llm1_payload(agency_record_number),
+    )
+
+    assert list(result.suggested_action_json) == [
+        "schema_version",
+        "language",
+        "case_id",
+        "agency_record_number",
+        "suggestion",
+        "support_recommendation",
+        "rationale",
+        "policy_alignment",
+        "confidence",
+    ]
+
+
+class FailingInteractionRepository:
+    async def append_case_llm_interaction(self, payload: CaseLlmInteractionCreateInput) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("transcript store unavailable")
+
+
+@pytest.mark.asyncio
+async def test_llm2_capture_failure_fails_run_but_keeps_llm2_error() -> None:
+    case_id = uuid4()
+    agency_record_number = "12345"
+    repository = cast(CaseRepositoryPort, FailingInteractionRepository())
+    response = json.dumps(_valid_llm2_payload(str(case_id), agency_record_number))
+    service = Llm2Service(llm_client=FakeLlmClient(response))
+
+    with pytest.raises(RuntimeError, match="transcript store unavailable"):
+        await service.run(
+            case_id=case_id,
+            agency_record_number=agency_record_number,
+            llm1_structured_data=_valid_llm1_payload(agency_record_number),
+            interaction_repository=repository,
+        )
+
+    failing_service = Llm2Service(llm_client=FakeLlmClient("not json"))
+    with pytest.raises(Llm2RetriableError) as error_info:
+        await failing_service.run(
+            case_id=case_id,
+            agency_record_number=agency_record_number,
+            llm1_structured_data=_valid_llm1_payload(agency_record_number),
+            interaction_repository=repository,
+        )
+    assert "non-JSON" in error_info.value.details
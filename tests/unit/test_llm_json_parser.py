@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import BaseModel, ValidationError
 
 from triage_automation.application.services.llm_json_parser import (
     LlmJsonParseError,
+    decode_and_validate_llm_json,
     decode_llm_json_object,
 )
 
 
+class _Payload(BaseModel):
+    a: int
+
+
 def test_decode_llm_json_object_accepts_plain_json() -> None:
     decoded = decode_llm_json_object('{"a":1,"b":"x"}')
 
@@ -29,3 +35,16 @@ def test_decode_llm_json_object_accepts_embedded_json() -> None:
 def test_decode_llm_json_object_raises_for_non_json_payload() -> None:
     with pytest.raises(LlmJsonParseError):
         decode_llm_json_object("not-json")
+
+
+def test_decode_and_validate_llm_json_validates_plain_and_wrapped_json() -> None:
+    assert decode_and_validate_llm_json('{"a":1}', _Payload).a == 1
+    assert decode_and_validate_llm_json('```json\n{"a":2}\n```', _Payload).a == 2
+    assert decode_and_validate_llm_json('[{"a":3}]', _Payload).a == 3
+
+
+def test_decode_and_validate_llm_json_separates_parse_and_schema_errors() -> None:
+    with pytest.raises(LlmJsonParseError):
+        decode_and_validate_llm_json("not json", _Payload)
+    with pytest.raises(ValidationError):
+        decode_and_validate_llm_json('{"a":"x"}', _Payload)
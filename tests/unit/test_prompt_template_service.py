@@ -47,3 +47,42 @@ async def test_service_raises_explicit_error_when_active_prompt_missing() -> Non
         await service.get_required_active_prompt(name="llm2_user")
 
     assert "llm2_user" in str(error_info.value)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_service_caches_prompt_pair_until_ttl_expires() -> None:
+    repo = FakePromptTemplateRepository(
+        PromptTemplateRecord(name="llm1_system", version=3, content="prompt content")
+    )
+    clock = FakeClock()
+    service = PromptTemplateService(
+        prompt_templates=repo,
+        pair_cache_ttl_seconds=10.0,
+        clock=clock,
+    )
+
+    first = await service.get_required_active_prompt_pair(
+        system_prompt_name="llm1_system",
+        user_prompt_name="llm1_user",
+    )
+    second = await service.get_required_active_prompt_pair(
+        system_prompt_name="llm1_system",
+        user_prompt_name="llm1_user",
+    )
+    assert second is first
+    assert repo.names == ["llm1_system", "llm1_user"]
+
+    clock.now = 10.0
+    await service.get_required_active_prompt_pair(
+        system_prompt_name="llm1_system",
+        user_prompt_name="llm1_user",
+    )
+    assert len(repo.names) == 4
@@ -11,6 +11,7 @@ from triage_automation.infrastructure.matrix.message_templates import (
     build_room2_case_pdf_attachment_filename,
     build_room2_case_pdf_formatted_html,
     build_room2_case_pdf_message,
+    build_room2_case_summary_bodies,
     build_room2_case_summary_formatted_html,
     build_room2_case_summary_message,
     build_room2_decision_ack_message,
@@ -234,6 +235,122 @@ def test_build_room2_case_summary_formatted_html_formats_recent_denial_datetime_
     assert "Data/hora da negativa mais recente: 15/02/2026 12:30 BRT" in body
 
 
+def test_build_room2_case_summary_bodies_render_expected_markdown_and_html() -> None:
+    body, formatted_body = build_room2_case_summary_bodies(
+        case_id=UUID("22222222-2222-2222-2222-222222222222"),
+        agency_record_number="12345",
+        patient_name="PACIENTE",
+        structured_data={
+            "policy_precheck": {
+                "labs_pass": "no",
+                "ecg_present": "yes",
+                "labs_failed_items": ["hb"],
+            },
+            "eda": {"labs": {"hb_g_dl": 6.8}},
+        },
+        summary_text="Resumo LLM1. Segunda linha <com marcação>.",
+        suggested_action={"suggestion": "deny", "support_recommendation": "none"},
+        recent_denial_context={
+            "decision": "deny_triage",
+            "reason": "criterio clinico",
+            "decided_at": datetime(2026, 2, 15, 15, 30, tzinfo=UTC),
+            "prior_denial_count_7d": 1,
+        },
+    )
+
+    assert body == (
+        "# Resumo técnico da triagem\n"
+        "\n"
+        "no. ocorrência: 12345\n"
+        "paciente: PACIENTE\n"
+        "\n"
+        "## Resumo clínico:\n"
+        "\n"
+        "Resumo LLM1. Segunda\n"
+        "linha <com marcação>.\n"
+        "\n"
+        "## Achados críticos:\n"
+        "\n"
+        "- Hb: 6.8\n"
+        "- Plaquetas: não informado\n"
+        "- INR: não informado\n"
+        "- ECG presente: não informado\n"
+        "- ECG sinal de alerta: não informado\n"
+        "\n"
+        "## Pendências críticas:\n"
+        "\n"
+        "- Pré-check laboratório: nao\n"
+        "- Pré-check ECG: sim\n"
+        "- Pendências de laboratório: hb\n"
+        "\n"
+        "## Decisão sugerida:\n"
+        "\n"
+        "- negar\n"
+        "\n"
+        "## Suporte recomendado:\n"
+        "\n"
+        "- nenhum\n"
+        "\n"
+        "## Motivo objetivo:\n"
+        "\n"
+        "- Decisão negar com suporte nenhum.\n"
+        "\n"
+        "## Conduta sugerida:\n"
+        "\n"
+        "- Reavaliar após resolução das pendências críticas.\n"
+        "- Priorizar coleta/validação dos exames pendentes críticos.\n"
+        "- Consultar relatório completo para suporte à decisão.\n"
+        "\n"
+        "## Histórico de negativa recente:\n"
+        "\n"
+        "- Tipo da negativa mais recente: negado na triagem.\n"
+        "- Motivo da negativa mais recente: criterio clinico\n"
+        "- Data/hora da negativa mais recente: 15/02/2026 12:30 BRT\n"
+        "- Total de negativas nos últimos 7 dias: 1"
+    )
+    assert formatted_body == (
+        "<h1>Resumo técnico da triagem</h1>"
+        "<p>no. ocorrência: 12345</p>"
+        "<p>paciente: PACIENTE</p>"
+        "<h2>Resumo clínico:</h2>"
+        "<p>Resumo LLM1. Segunda</p>"
+        "<p>linha &lt;com marcação&gt;.</p>"
+        "<h2>Achados críticos:</h2>"
+        "<ul>"
+        "<li>Hb: 6.8</li>"
+        "<li>Plaquetas: não informado</li>"
+        "<li>INR: não informado</li>"
+        "<li>ECG presente: não informado</li>"
+        "<li>ECG sinal de alerta: não informado</li>"
+        "</ul>"
+        "<h2>Pendências críticas:</h2>"
+        "<ul>"
+        "<li>Pré-check laboratório: nao</li>"
+        "<li>Pré-check ECG: sim</li>"
+        "<li>Pendências de laboratório: hb</li>"
+        "</ul>"
+        "<h2>Decisão sugerida:</h2>"
+        "<ul><li>negar</li></ul>"
+        "<h2>Suporte recomendado:</h2>"
+        "<ul><li>nenhum</li></ul>"
+        "<h2>Motivo objetivo:</h2>"
+        "<ul><li>Decisão negar com suporte nenhum.</li></ul>"
+        "<h2>Conduta sugerida:</h2>"
+        "<ul>"
+        "<li>Reavaliar após resolução das pendências críticas.</li>"
+        "<li>Priorizar coleta/validação dos exames pendentes críticos.</li>"
+        "<li>Consultar relatório completo para suporte à decisão.</li>"
+        "</ul>"
+        "<h2>Histórico de negativa recente:</h2>"
+        "<ul>"
+        "<li>Tipo da negativa mais recente: negado na triagem.</li>"
+        "<li>Motivo da negativa mais recente: criterio clinico</li>"
+        "<li>Data/hora da negativa mais recente: 15/02/2026 12:30 BRT</li>"
+        "<li>Total de negativas nos últimos 7 dias: 1</li>"
+        "</ul>"
+    )
+
+
 def test_build_room2_case_decision_instructions_message_has_strict_template() -> None:
     case_id = UUID("33333333-3333-3333-3333-333333333333")
 
@@ -93,6 +93,9 @@ class FakeAuditRepository:
         self.events.append(payload)
         return len(self.events)
 
+    async def append_events(self, payloads: list[AuditEventCreateInput]) -> None:
+        self.events.extend(payloads)
+
 
 class FakeJobFailureService:
     def __init__(self) -> None: